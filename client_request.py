@@ -1,19 +1,28 @@
-import requests
+import asyncio
+import httpx
 import json
-import pandas as pd 
-import os
+from itertools import islice
 
-
-pd.options.display.max_columns = None
+# HTTP/2 needs the h2 package (pip install "httpx[http2]"); fall back to HTTP/1.1 keep-alive without it
+try:
+    import h2  # noqa: F401
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
 
 EIE_config = {
     'tickers_list': [],
+    'batch_size': 25,
+    # Server pool holds 20 connections and each request uses 1 plus up to 2 event readers
+    'max_concurrent': 6,
 }
 
-# GraphQL query using variables; schema supports only tickers_list
+URL = 'SERVER_URL/graphql'  # Replace SERVER_URL with actual server URL
+
+# GraphQL query using variables; skip_indicators limits a request to the asset events step
 query = '''
-query($tickers: [String!]) {
-  EIE_Calculator(tickers_list: $tickers) {
+query($tickers: [String!], $skip: Boolean) {
+  EIE_Calculator(tickers_list: $tickers, skip_indicators: $skip) {
     success
     error
     message
@@ -23,8 +32,6 @@ query($tickers: [String!]) {
 }
 '''
 
-variables = {"tickers": EIE_config["tickers_list"]}
-
 headers = {
         'Accept-Encoding': 'gzip, deflate, br',
         'Content-Type': 'application/json',
@@ -33,37 +40,54 @@ headers = {
         'DNT': '1'
     }
 
-resp = requests.post(
-    'SERVER_URL/graphql',  # Replace SERVER_URL with actual server URL
-    json={"query": query, "variables": variables},
-    headers=headers
-)
+# Split tickers_list into batches; an empty list is sent as-is (server processes all symbols)
+def shard(tickers, size):
+    it = iter(tickers)
+    batches = list(iter(lambda: list(islice(it, size)), []))
+    return batches or [[]]
 
-# Guard against non-JSON or server errors
-try:
-    response = resp.json()
-except Exception:
-    print('HTTP error:', resp.status_code, resp.text)
-    raise
+# Send the first batch alone (it also runs the economic indicators step), then the remaining
+# batches with skip_indicators over one keep-alive connection, at most max_concurrent in flight
+async def run(batches, max_concurrent):
+    limit = asyncio.Semaphore(max_concurrent)
+    async with httpx.AsyncClient(http2=HTTP2, headers=headers, timeout=None) as c:
+        post = lambda b, skip: c.post(URL, json={"query": query, "variables": {"tickers": b, "skip": skip}})
+
+        async def post_limited(b):
+            async with limit:
+                return await post(b, True)
+
+        first = await post(batches[0], False)
+        return [first, *await asyncio.gather(*[post_limited(b) for b in batches[1:]])]
+
+responses = asyncio.run(run(shard(EIE_config["tickers_list"], EIE_config["batch_size"]), EIE_config["max_concurrent"]))
+
+for resp in responses:
+    # Guard against non-JSON or server errors
+    try:
+        response = resp.json()
+    except Exception:
+        print('HTTP error:', resp.status_code, resp.text)
+        raise
 
-# If GraphQL returned errors, print them and exit gracefully
-if 'errors' in response and response.get('errors'):
-    print('GraphQL errors:', json.dumps(response['errors'], ensure_ascii=False, indent=2))
-    # Optionally stop here
-    raise SystemExit(1)
+    # If GraphQL returned errors, print them and exit gracefully
+    if 'errors' in response and response.get('errors'):
+        print('GraphQL errors:', json.dumps(response['errors'], ensure_ascii=False, indent=2))
+        # Optionally stop here
+        raise SystemExit(1)
 
-# Safe access to data
-data = response.get('data', {})
-result = data.get('EIE_Calculator', {})
+    # Safe access to data
+    data = response.get('data', {})
+    result = data.get('EIE_Calculator', {})
 
-success = result.get('success')
-error = result.get('error')
-message = result.get('message')
-ind = result.get('indicators_inserted')
-ev = result.get('events_inserted')
+    success = result.get('success')
+    error = result.get('error')
+    message = result.get('message')
+    ind = result.get('indicators_inserted')
+    ev = result.get('events_inserted')
 
-print('success:', success)
-print('error:', error)
-print('message:', message)
-print('indicators_inserted:', ind)
-print('events_inserted:', ev)
\ No newline at end of file
+    print('success:', success)
+    print('error:', error)
+    print('message:', message)
+    print('indicators_inserted:', ind)
+    print('events_inserted:', ev)
\ No newline at end of file
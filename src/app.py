@@ -3,7 +3,33 @@ from ariadne import load_schema_from_path, make_executable_schema, \
     graphql_sync, snake_case_fallback_resolvers, ObjectType
 # from ariadne.constants import PLAYGROUND_HTML
 from flask import request, jsonify, Flask
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from functools import lru_cache
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import orjson
+# Log records are queued by request threads and written to stderr by a background listener thread
+_log_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[_log_handler])
+_log_listener = None
+
+# Start a listener for this process; threads don't survive fork, so forked workers (gunicorn --preload)
+# get a fresh queue and listener of their own instead of queueing into a copy nothing reads
+def _start_log_listener(new_queue=False):
+    global _log_listener
+    if new_queue:
+        _log_handler.queue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(_log_handler.queue, logging.StreamHandler())
+    _log_listener.start()
+
+_start_log_listener()
+os.register_at_fork(after_in_child=lambda: _start_log_listener(new_queue=True))
+atexit.register(lambda: _log_listener.stop())
+
 # from main import resolve_Intraday_API
 from main import resolve_EIE
 import settings
@@ -11,11 +37,31 @@ import settings
 query = ObjectType("Query")
 query.set_field("EIE_Calculator", resolve_EIE)
 
-type_defs = load_schema_from_path("/kns-dta-data-kubernetes-namespace-tst-tst-kct/EIE-Economic_Indicators_Extractor.Bot-API_2.0/schema.graphql")
-schema = make_executable_schema(
-    type_defs, query, snake_case_fallback_resolvers
-)
+SCHEMA_PATH = "/kns-dta-data-kubernetes-namespace-tst-tst-kct/EIE-Economic_Indicators_Extractor.Bot-API_2.0/schema.graphql"
+
+# Compiled schema is cached per file mtime; rebuilt only when schema.graphql changes
+@lru_cache(maxsize=1)
+def _schema(mtime):
+    type_defs = load_schema_from_path(SCHEMA_PATH)
+    return make_executable_schema(
+        type_defs, query, snake_case_fallback_resolvers
+    )
+
+def get_schema():
+    return _schema(os.path.getmtime(SCHEMA_PATH))
+
+# Build at import so forking servers (gunicorn --preload) share the compiled schema
+get_schema()
+# JSON provider backed by orjson (C encoder, native datetime support)
+class ORJSONProvider(JSONProvider):
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=str).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)
 # schema.type_map['NumpyArray'] = numpy_array_scalar
 
@@ -25,7 +71,13 @@ def health():
 
 @app.route("/graphql", methods=["POST"])
 def graphql_server():
+    schema = get_schema()
     data = request.get_json()
+    # Batched queries: array body of {query, variables} items, answered with an array
+    if isinstance(data, list):
+        results = [graphql_sync(schema, d, context_value=request, debug=app.debug) for d in data]
+        status_code = 200 if all(success for success, _ in results) else 400
+        return jsonify([result for _, result in results]), status_code
     success, result = graphql_sync(
         schema,
         data,
@@ -33,7 +85,6 @@ def graphql_server():
         debug=app.debug
     )
     status_code = 200 if success else 400
-    print(jsonify(result))
     return jsonify(result), status_code
 
 if __name__ == '__main__':
@@ -1,62 +1,120 @@
 # ==============================================================================
 # IMPORTS - Economic Indicators Extractor Bot
 # ==============================================================================
-from datetime import datetime, timedelta
+from datetime import datetime, date, timedelta
 from queries import (TREASURY_YIELD, FEDERAL_FUNDS_RATE, CPI, RETAIL_SALES, INFLATION, 
                     DURABLES, UNEMPLOYMENT, NONFARM_PAYROLL, REAL_GDP, REAL_GDP_PC, 
-                    EARNINGS, DIVIDENDS, STOCK_SPLITS, EARNINGS_CALENDAR)
+                    EARNINGS, DIVIDENDS, STOCK_SPLITS, EARNINGS_CALENDAR, clear_all_caches)
+from settings import get_pg_pool
 from uuid import uuid4
-import io, json, csv, psycopg2, time as time_module
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import chain
+from psycopg2.extras import execute_values
+from psycopg2.pool import PoolError
+from requests.exceptions import RequestException
+import io, csv, gc, heapq, logging, orjson, psycopg2, random, time as time_module
 from decimal import Decimal
+from types import MappingProxyType
+
+# Module logger - handlers are configured by the application (see app.py)
+logger = logging.getLogger(__name__)
+
+# ==============================================================================
+# SQL STATEMENTS - Built once per interval table at import time
+# ==============================================================================
+
+# Identifier placeholders ({col}, {max_exprs}, {copy_cols}, {insert_cols}, {set_cols}) are filled via str.format; values stay %s parameters
+SQL = {
+    iv: {
+        'max_date_expr': f', MAX("{iv}_economic_indicator_date") FILTER (WHERE "{iv}_economic_indicator_{{col}}" IS NOT NULL)',
+        'max_id': f'SELECT MAX("{iv}_economic_indicator_ID"){{max_exprs}} FROM "dyGEO".{iv}_economic_indicator_log',
+        'update': f'''UPDATE "dyGEO".{iv}_economic_indicator_log AS t 
+                    SET "{iv}_economic_indicator_{{col}}" = v.val 
+                    FROM (VALUES %s) AS v(d, val) 
+                    WHERE t."{iv}_economic_indicator_date" = v.d
+                    RETURNING t."{iv}_economic_indicator_date"''',
+        'copy_col': f', "{iv}_economic_indicator_{{col}}"',
+        'insert_cols': f'''"{iv}_economic_indicator_ID", "{iv}_economic_indicator_country_PK", 
+                         "{iv}_economic_indicator_date"{{copy_cols}}''',
+        'stage': f'''CREATE TEMP TABLE staged_indicator_rows ON COMMIT DROP AS 
+                   SELECT {{insert_cols}} FROM "dyGEO".{iv}_economic_indicator_log WITH NO DATA''',
+        'copy': 'COPY staged_indicator_rows FROM STDIN WITH (FORMAT CSV)',
+        'set_col': f'"{iv}_economic_indicator_{{col}}" = COALESCE(s."{iv}_economic_indicator_{{col}}", t."{iv}_economic_indicator_{{col}}")',
+        'update_staged': f'''UPDATE "dyGEO".{iv}_economic_indicator_log AS t SET {{set_cols}}
+                           FROM staged_indicator_rows s
+                           WHERE t."{iv}_economic_indicator_date" = s."{iv}_economic_indicator_date"''',
+        'insert_staged': f'''INSERT INTO "dyGEO".{iv}_economic_indicator_log ({{insert_cols}}) 
+                           SELECT {{insert_cols}} FROM staged_indicator_rows s 
+                           WHERE NOT EXISTS (SELECT 1 FROM "dyGEO".{iv}_economic_indicator_log t 
+                                             WHERE t."{iv}_economic_indicator_date" = s."{iv}_economic_indicator_date")
+                           RETURNING "{iv}_economic_indicator_date"''',
+    }
+    for iv in ('daily', 'weekly', 'monthly', 'quarterly', 'semiannual', 'annual')
+}
 
 # ==============================================================================
 # UTILITY FUNCTIONS - Data Processing Helpers
 # ==============================================================================
 
 # Fill missing values in economic indicator time series using forward/backward fill
-def forward_backward_fill_indicator(cursor, table_name, column_name, interval):
-    """Forward and backward fill missing values in economic indicator data"""
-    cursor.execute(f'SELECT "{interval}_economic_indicator_date", "{interval}_economic_indicator_{column_name}" FROM {table_name} ORDER BY "{interval}_economic_indicator_date"')
-    records = cursor.fetchall()
-    if not records:
-        return
-    
-    # Find first valid value for backward fill
-    first_valid_value = next((r[1] for r in records if r[1] is not None), None)
-    if first_valid_value is None:
-        return
-    
-    # Prepare updates for missing values
-    updates = []
-    last_known_value = first_valid_value
-    for record in records:
-        if record[1] is not None:
-            last_known_value = record[1]
-        else:
-            updates.append((last_known_value, record[0]))
-    
-    # Apply updates if any missing values found
-    if updates:
-        cursor.executemany(f'UPDATE {table_name} SET "{interval}_economic_indicator_{column_name}" = %s WHERE "{interval}_economic_indicator_date" = %s AND "{interval}_economic_indicator_{column_name}" IS NULL', updates)
+def forward_backward_fill_indicator(cursor, table_name, column_names, interval):
+    """Forward and backward fill missing values for all given columns of one table (single server-side UPDATE)"""
+    date_col = f'"{interval}_economic_indicator_date"'
+    value_cols = [f'"{interval}_economic_indicator_{c}"' for c in column_names]
+    idx = range(len(value_cols))
+    # grp_i counts non-null values seen so far, so each null shares a group with the last known value;
+    # leading nulls (grp_i = 0) are backward filled with the first valid value
+    grp_exprs = ', '.join(f'{col} AS v{i}, COUNT({col}) OVER (ORDER BY {date_col} ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW) AS grp{i}'
+                          for i, col in enumerate(value_cols))
+    fill_exprs = ', '.join(f'''CASE WHEN grp{i} = 0
+                                   THEN (SELECT v{i} FROM ordered WHERE v{i} IS NOT NULL ORDER BY d LIMIT 1)
+                                   ELSE FIRST_VALUE(v{i}) OVER (PARTITION BY grp{i} ORDER BY d ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW)
+                              END AS fv{i}''' for i in idx)
+    set_exprs = ', '.join(f'{col} = COALESCE(t.{col}, filled.fv{i})' for i, col in enumerate(value_cols))
+    where_expr = ' OR '.join(f'(t.{col} IS NULL AND filled.fv{i} IS NOT NULL)' for i, col in enumerate(value_cols))
+    cursor.execute(f'''WITH ordered AS (
+                          SELECT {date_col} AS d, {grp_exprs}
+                          FROM {table_name}
+                      ), filled AS (
+                          SELECT d, {fill_exprs}
+                          FROM ordered
+                      )
+                      UPDATE {table_name} AS t SET {set_exprs}
+                      FROM filled
+                      WHERE t.{date_col} = filled.d AND ({where_expr})''')
+
+# Fast path for parsing 'YYYY-MM-DD' strings, avoids strptime format parsing per call
+def _fast_date(s):
+    """Parse ISO date string (YYYY-MM-DD) into date object"""
+    return date.fromisoformat(s)
 
 # Parse date string into date object, handles various formats and invalid inputs
 def parse_date(date_str, fmt="%Y-%m-%d"):
     """Parse date string with error handling"""
     if not date_str or date_str in ["N/A", "", None]:
         return None
+    # Fast path for canonical ISO dates, strptime only for other formats/shapes
+    if fmt == "%Y-%m-%d" and len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        try:
+            return _fast_date(date_str)
+        except Exception:
+            pass
     try:
         return datetime.strptime(date_str, fmt).date()
     except Exception:
         return None
 
+# Quarter label by month number (index 0 unused), replaces per-row month arithmetic and formatting
+QUARTER_BY_MONTH = (None, 'Q1', 'Q1', 'Q1', 'Q2', 'Q2', 'Q2', 'Q3', 'Q3', 'Q3', 'Q4', 'Q4', 'Q4')
+
 # Extract quarter (Q1, Q2, Q3, Q4) from date string
 def get_quarter_from_date(date_str):
     """Extract quarter from date string"""
     if not date_str:
         return None
     try:
-        month = datetime.strptime(date_str, '%Y-%m-%d').month
-        return f"Q{(month-1)//3 + 1}"
+        return QUARTER_BY_MONTH[parse_date(date_str).month]
     except:
         return None
 
@@ -66,239 +124,374 @@ def compute_split_ratio_str(factor):
     if factor is None or factor == '':
         return None
     try:
-        f = Decimal(str(factor))
+        f = float(factor)
         if f == 1:
             return None
         if f > 1:
-            return f"{int(f.quantize(Decimal(1)))}-for-1"
+            return f"{round(f)}-for-1"
         else:
-            return f"Reverse {int((Decimal(1) / f).quantize(Decimal(1)))}-for-1"
+            return f"Reverse {round(1 / f)}-for-1"
     except Exception:
         return None
 
-# Sanitize data for being inserted into the notes column
-def sanitize_for_text(obj):
-    """Sanitize data for being inserted into the notes column"""
+# Call indicator API function, passing the interval only to functions that accept it
+def _fetch_indicator_data(data_func, takes_interval, interval, force_refresh=False):
+    """Fetch raw API response for an indicator/interval pair"""
+    if takes_interval:
+        return data_func(interval, force_refresh=force_refresh)
+    return data_func(force_refresh=force_refresh)
+
+# orjson default hook for types it doesn't serialize natively (Decimal -> str)
+def _coerce(obj):
+    """Coerce non-native types when serializing the notes column"""
     if isinstance(obj, Decimal):
         return str(obj)
-    if isinstance(obj, datetime):
-        return obj.strftime('%Y-%m-%dT%H:%M:%S')
-    if isinstance(obj, (list, tuple)):
-        return [sanitize_for_text(x) for x in obj]
-    if isinstance(obj, dict):
-        return {k: sanitize_for_text(v) for k, v in obj.items()}
-    return obj
+    raise TypeError
+
+# Serialize data for being inserted into the notes column
+def dumps_notes(obj):
+    """Serialize notes data to JSON text (datetimes without microseconds)"""
+    return orjson.dumps(obj, default=_coerce, option=orjson.OPT_OMIT_MICROSECONDS).decode()
+
+# Format the data part of one asset event COPY TEXT row (everything after PK/ID/UUID)
+def _format_event_row(event_pk, ann_date, start_date, audit_cols, notes_json):
+    """Build a tab-separated event row; orjson never emits raw tab/newline/CR, so only backslashes need escaping"""
+    ann_str = ann_date.isoformat() if ann_date else '\\N'
+    start_str = start_date.isoformat() if start_date else '\\N'
+    notes_str = notes_json.replace('\\', '\\\\')
+    return f'{event_pk}\t{ann_str}\t{start_str}\t{audit_cols}\t{notes_str}'
+
+# Read-only file-like object fed by an iterator of strings, lets copy_expert stream rows without building the whole payload
+class IteratorFile:
+    """Minimal file object whose read(size) pulls lazily from an iterator of strings"""
+    def __init__(self, rows):
+        self._rows = iter(rows)
+        self._buffer = ''
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._rows, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            data, self._buffer = self._buffer, ''
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+# Suspend the cyclic garbage collector while a hot loop allocates many short-lived containers
+@contextmanager
+def gc_disabled():
+    """Disable gc for the block, restoring the previous state afterwards"""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
 
 # ==============================================================================
 # ECONOMIC INDICATORS PROCESSING - Fetch and Store Economic Data
 # ==============================================================================
 
 # Main function to process economic indicators from various APIs
-def process_economic_indicators(cursor, interval_list, items, shown_warnings, already_reported):
+def process_economic_indicators(cursor, interval_list, items, shown_warnings, already_reported, force_refresh=False):
     """
     Extract, transform and load economic indicators data
     Handles: GDP, Treasury yields, Federal funds rate, CPI, inflation, unemployment, etc.
+    force_refresh bypasses the API response cache
     """
-    print("\n[EXTRACTION] Starting economic indicators processing...")
+    logger.info("[EXTRACTION] Starting economic indicators processing...")
     
     indicators_already_available = []
     no_values_by_interval = {}
     total_indicators_inserted = 0
     
-    # Mapping of indicators to their API functions and column names
+    # Mapping of indicators to their column names, API functions and whether the function takes an interval
     indicator_map = {
-        'real_GDP_interval_list': ('RGDPBUSD_value', REAL_GDP),
-        'real_GDP_pc_interval_list': ('RGDPCBUSD_value', lambda: REAL_GDP_PC()),
-        'Treasury_yield_interval_list': ('TCMRP_value', TREASURY_YIELD),
-        'Federal_funds_interval_list': ('EFFRP_value', FEDERAL_FUNDS_RATE),
-        'CPI_interval_list': ('CPIAUC_value', CPI),
-        'inflation_interval_list': ('ICPP_value', lambda: INFLATION()),
-        'retail_sales_interval_list': ('ARSRTMUSD_value', lambda: RETAIL_SALES()),
-        'durables_interval_list': ('MNODGMUSD_value', lambda: DURABLES()),
-        'unemployment_interval_list': ('URP_value', lambda: UNEMPLOYMENT()),
-        'nonfarm_payrolls_interval_list': ('TNPTP_value', lambda: NONFARM_PAYROLL())
+        'real_GDP_interval_list': ('RGDPBUSD_value', REAL_GDP, True),
+        'real_GDP_pc_interval_list': ('RGDPCBUSD_value', REAL_GDP_PC, False),
+        'Treasury_yield_interval_list': ('TCMRP_value', TREASURY_YIELD, True),
+        'Federal_funds_interval_list': ('EFFRP_value', FEDERAL_FUNDS_RATE, True),
+        'CPI_interval_list': ('CPIAUC_value', CPI, True),
+        'inflation_interval_list': ('ICPP_value', INFLATION, False),
+        'retail_sales_interval_list': ('ARSRTMUSD_value', RETAIL_SALES, False),
+        'durables_interval_list': ('MNODGMUSD_value', DURABLES, False),
+        'unemployment_interval_list': ('URP_value', UNEMPLOYMENT, False),
+        'nonfarm_payrolls_interval_list': ('TNPTP_value', NONFARM_PAYROLL, False)
     }
     
     # Database column prefixes for different time intervals
-    prefix_map = {'daily': 'D', 'weekly': 'W', 'monthly': 'M', 'quarterly': 'Q', 'semiannual': 'SA', 'annual': 'A'}
+    prefix_map = _PREFIX_MAP
     
-    # Process each time interval (daily, weekly, monthly, etc.)
-    for list_ in interval_list:
-        monitoring_count, follow_up_count = 0, 0
+    # Start all API requests concurrently - calls are independent and network-bound. Each interval
+    # waits only for its own responses, so DB work on earlier intervals overlaps later downloads
+    tasks = [(list_, indicator) for list_ in interval_list for indicator, interval_ in items
+             if list_ in interval_ and indicator in indicator_map]
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        responses = {key: executor.submit(_fetch_indicator_data, *indicator_map[key[1]][1:], key[0], force_refresh) for key in tasks}
+        
+        # COPY payload buffer, reused across indicators
+        output = io.StringIO()
+        
+        # Process each time interval (daily, weekly, monthly, etc.)
+        for list_ in interval_list:
+            monitoring_count, follow_up_count = 0, 0
+        
+            # Fetch last available date per indicator column and the max ID in one aggregate query
+            cols = [prefix_map[list_] + indicator_map[ind][0] for ind, ivals in items if list_ in ivals and ind in indicator_map]
+            sql = SQL[list_]
+            max_exprs = ''.join(sql['max_date_expr'].format(col=c) for c in cols)
+            cursor.execute(sql['max_id'].format(max_exprs=max_exprs))
+            row = cursor.fetchone()
+            id_ = row[0] or 0
+            prev_by_col = dict(zip(cols, row[1:]))
+        
+            default_date = _fast_date('2000-01-01')
         
-        # Process each indicator for current interval
-        for item in items:
-            indicator, interval_ = item
+            # New rows for this interval keyed by date -> (ID, {column: value}), flushed with one COPY
+            pending_rows = {}
+        
+            # Process each indicator for current interval
+            for item in items:
+                indicator, interval_ = item
             
-            # Skip if indicator doesn't support this interval
-            if list_ not in interval_:
-                if list_ not in no_values_by_interval:
-                    no_values_by_interval[list_] = []
-                key = (indicator, list_)
-                if key not in already_reported:
-                    no_values_by_interval[list_].append(indicator.replace('_interval_list', ''))
-                    already_reported.add(key)
-                continue
+                # Skip if indicator doesn't support this interval
+                if list_ not in interval_:
+                    if list_ not in no_values_by_interval:
+                        no_values_by_interval[list_] = []
+                    key = (indicator, list_)
+                    if key not in already_reported:
+                        no_values_by_interval[list_].append(indicator.replace('_interval_list', ''))
+                        already_reported.add(key)
+                    continue
                 
-            # Skip if indicator not in our mapping
-            if indicator not in indicator_map:
-                continue
+                # Skip if indicator not in our mapping
+                if indicator not in indicator_map:
+                    continue
                 
-            column_suffix, data_func = indicator_map[indicator]
-            column_name = prefix_map[list_] + column_suffix
+                column_suffix = indicator_map[indicator][0]
+                column_name = prefix_map[list_] + column_suffix
             
-            # Get the last date we have data for this indicator
-            cursor.execute(f'''SELECT MAX("{list_}_economic_indicator_date") 
-                             FROM "dyGEO".{list_}_economic_indicator_log 
-                             WHERE "{list_}_economic_indicator_{column_name}" IS NOT NULL''')
-            prev_date = cursor.fetchone()[0] or datetime.strptime('2000-01-01', '%Y-%m-%d').date()
+                # Get the last date we have data for this indicator
+                prev_date = prev_by_col.get(column_name) or default_date
             
-            # Get next ID for new records
-            cursor.execute(f'SELECT MAX("{list_}_economic_indicator_ID") FROM "dyGEO".{list_}_economic_indicator_log')
-            id_ = cursor.fetchone()[0] or 0
-            
-            # Fetch data from API
-            try:
-                data = data_func(list_) if 'real_GDP' in indicator or 'Treasury' in indicator or 'Federal' in indicator or 'CPI' in indicator else data_func()
-            except TypeError:
-                data = data_func()
+                # Wait for this indicator's API response
+                data = responses[(list_, indicator)].result()
             
-            # Handle different API response formats
-            if isinstance(data, dict) and 'data' in data:
-                # New format: {"status": ..., "data": [...]}
-                data_list = data['data']
-            elif isinstance(data, dict) and 'data' not in data:
-                # Old format: direct data structure
-                data_list = data.get('data', data)  # Try 'data' key, fallback to entire dict
-            else:
-                # Fallback
-                data_list = data
+                # Handle different API response formats
+                if isinstance(data, dict) and 'data' in data:
+                    # New format: {"status": ..., "data": [...]}
+                    data_list = data['data']
+                elif isinstance(data, dict) and 'data' not in data:
+                    # Old format: direct data structure
+                    data_list = data.get('data', data)  # Try 'data' key, fallback to entire dict
+                else:
+                    # Fallback
+                    data_list = data
                 
-            # Filter for new data only (after our last date)
-            new_data = [entry for entry in data_list if datetime.strptime(entry['date'], '%Y-%m-%d').date() > prev_date]
-            new_data.reverse()
+                # Filter for new data only (after our last date) - ISO date strings compare in date order,
+                # so old rows are skipped without parsing; only new rows are parsed, once, newest last
+                prev_str = prev_date.isoformat()
+                new_data = [(_fast_date(entry['date']), entry) for entry in reversed(data_list) if entry['date'] > prev_str]
             
-            # Skip if no new data available
-            if not new_data:
-                key = (indicator, list_, str(prev_date))
-                if key not in already_reported:
-                    indicators_already_available.append(f"{indicator} ({list_}) till {prev_date}")
-                    already_reported.add(key)
-                continue
-                
-            # Process and organize data by date
-            date_data = {}
-            for entry in new_data:
-                date = datetime.strptime(entry['date'], '%Y-%m-%d').date()
+                # Skip if no new data available
+                if not new_data:
+                    key = (indicator, list_, str(prev_date))
+                    if key not in already_reported:
+                        indicators_already_available.append(f"{indicator} ({list_}) till {prev_date}")
+                        already_reported.add(key)
+                    continue
                 
-                # Special handling for weekly federal funds rate (adjust by 5 days)
-                if column_name == 'WEFFRP_value':
-                    date = date - timedelta(days=5)
-                    if date == prev_date:
-                        continue
+                # Process data into flat (date, value) rows - one column per indicator pass
+                rows = []
+                for obs_date, entry in new_data:
+                    # Special handling for weekly federal funds rate (adjust by 5 days)
+                    if column_name == 'WEFFRP_value':
+                        obs_date = obs_date - timedelta(days=5)
+                        if obs_date == prev_date:
+                            continue
                         
-                value_ = entry['value']
-                if value_ in ['.', '']:
-                    continue
+                    value_ = entry['value']
+                    if value_ in ['.', '']:
+                        continue
                     
-                # Convert value to appropriate numeric type
-                try:
-                    if column_name in ["MTNPTP_value", "TNPTP_value", "DTCMRP_value"] or "TNPTP_value" in column_name or "DTCMRP_value" in column_name:
-                        value = int(float(value_))
-                    else:
-                        value = float(value_)
-                except (ValueError, TypeError):
-                    warning_msg = f"Could not convert value '{value_}' for {column_name}"
-                    if warning_msg not in shown_warnings:
-                        print(f"[WARNING] {warning_msg}")
-                        shown_warnings.add(warning_msg)
-                    continue
+                    # Convert value to appropriate numeric type
+                    try:
+                        if column_name in ["MTNPTP_value", "TNPTP_value", "DTCMRP_value"] or "TNPTP_value" in column_name or "DTCMRP_value" in column_name:
+                            value = int(float(value_))
+                        else:
+                            value = float(value_)
+                    except (ValueError, TypeError):
+                        warning_msg = f"Could not convert value '{value_}' for {column_name}"
+                        if warning_msg not in shown_warnings:
+                            logger.warning("[WARNING] %s", warning_msg)
+                            shown_warnings.add(warning_msg)
+                        continue
                     
-                if date not in date_data:
-                    date_data[date] = {}
-                date_data[date][column_name] = value
+                    rows.append((obs_date, value))
                 
-                # Progress monitoring
-                monitoring_count += 1
-                if monitoring_count == follow_up_count + 1000:
-                    print(f"[INFO] Processed {monitoring_count} records for {indicator} ({list_})")
-                    follow_up_count += 1000
+                    # Progress monitoring
+                    monitoring_count += 1
+                    if monitoring_count == follow_up_count + 1000:
+                        logger.info("[INFO] Processed %s records for %s (%s)", monitoring_count, indicator, list_)
+                        follow_up_count += 1000
             
-            # Insert/update data if we have any
-            if date_data:
-                # Check which dates already exist in database
-                dates_list = list(date_data.keys())
-                cursor.execute(f'''SELECT "{list_}_economic_indicator_date", "{list_}_economic_indicator_PK"
-                                 FROM "dyGEO".{list_}_economic_indicator_log 
-                                 WHERE "{list_}_economic_indicator_date" = ANY(%s)''', (dates_list,))
-                existing_dates = dict(cursor.fetchall())
-                
-                # Separate updates vs inserts
-                updates, inserts = [], []
-                for date, values in date_data.items():
-                    id_ += 1
-                    if date in existing_dates:
-                        # Update existing record
-                        pk = existing_dates[date]
-                        for col, val in values.items():
-                            updates.append((val, pk, col))
-                    else:
-                        # Insert new record
-                        inserts.append((id_, 237, date, values.get(column_name)))
-                
-                # Execute batch updates
-                for value, pk, col in updates:
-                    cursor.execute(f'''UPDATE "dyGEO".{list_}_economic_indicator_log 
-                                     SET "{list_}_economic_indicator_{col}" = %s 
-                                     WHERE "{list_}_economic_indicator_PK" = %s''', (value, pk))
-                
-                # Execute batch inserts using COPY for performance
-                if inserts:
-                    output = io.StringIO()
-                    for row in inserts:
-                        output.write(f"{row[0]},{row[1]},{row[2]},{row[3] if row[3] is not None else ''}\n")
-                    output.seek(0)
-                    cursor.copy_expert(f'''COPY "dyGEO".{list_}_economic_indicator_log 
-                                         ("{list_}_economic_indicator_ID", "{list_}_economic_indicator_country_PK", 
-                                          "{list_}_economic_indicator_date", "{list_}_economic_indicator_{column_name}") 
-                                         FROM STDIN WITH (FORMAT CSV)''', output)
-                    total_indicators_inserted += len(inserts)
+                # Insert/update data if we have any
+                if rows:
+                    # Update rows whose date already exists in one UPDATE ... FROM (VALUES ...) ... RETURNING;
+                    # dates the UPDATE didn't match are new and queued for the interval COPY. Isolated in a
+                    # savepoint so a failing indicator doesn't abort the interval
+                    cursor.execute('SAVEPOINT indicator_sp')
+                    try:
+                        updated = execute_values(cursor, sql['update'].format(col=column_name), rows, template="(%s,%s)", page_size=1000, fetch=True)
+                        cursor.execute('RELEASE SAVEPOINT indicator_sp')
+                    except Exception as e:
+                        cursor.execute('ROLLBACK TO SAVEPOINT indicator_sp')
+                        logger.warning("[WARN] Failed loading %s (%s): %s", indicator, list_, e)
+                        continue
+                    updated_dates = {r[0] for r in updated}
+                    inserts = [(obs_date, value) for obs_date, value in rows if obs_date not in updated_dates]
                 
-                cursor.connection.commit()
+                    # Merge inserts into pending rows - indicators sharing a new date share one row
+                    for obs_date, value in inserts:
+                        if obs_date not in pending_rows:
+                            id_ += 1
+                            pending_rows[obs_date] = (id_, {})
+                        pending_rows[obs_date][1][column_name] = value
+        
+            # Execute batch inserts for all indicators of this interval using a single multi-column COPY into a
+            # temp staging table; dates another run inserted meanwhile get the staged values merged in by one
+            # UPDATE ... FROM (empty CSV fields are NULL and keep the existing value), the rest one INSERT ... SELECT
+            if pending_rows:
+                copy_cols = [c for c in cols if any(c in values for _, values in pending_rows.values())]
+                output.seek(0)
+                output.truncate(0)
+                csv.writer(output).writerows((row_id, 237, obs_date.isoformat(), *(values.get(c, '') for c in copy_cols))
+                                             for obs_date, (row_id, values) in pending_rows.items())
+                output.seek(0)
+                insert_cols = sql['insert_cols'].format(copy_cols=''.join(sql['copy_col'].format(col=c) for c in copy_cols))
+                cursor.execute('SAVEPOINT interval_copy_sp')
+                try:
+                    cursor.execute(sql['stage'].format(insert_cols=insert_cols))
+                    cursor.copy_expert(sql['copy'], output)
+                    cursor.execute(sql['update_staged'].format(set_cols=', '.join(sql['set_col'].format(col=c) for c in copy_cols)))
+                    merged = cursor.rowcount
+                    cursor.execute(sql['insert_staged'].format(insert_cols=insert_cols))
+                    inserted_dates = [r[0] for r in cursor.fetchall()]
+                    cursor.execute('RELEASE SAVEPOINT interval_copy_sp')
+                    # Count only values of rows actually inserted
+                    total_indicators_inserted += sum(len(pending_rows[d][1]) for d in inserted_dates)
+                    if merged:
+                        logger.info("[INFO] Merged new %s values into %s rows inserted by another run", list_, merged)
+                except Exception as e:
+                    cursor.execute('ROLLBACK TO SAVEPOINT interval_copy_sp')
+                    logger.warning("[WARN] Failed inserting new %s economic indicator records: %s", list_, e)
+        
+            cursor.connection.commit()
     
     # Print summary of processing results
     for interval, indicators in no_values_by_interval.items():
         if indicators:
-            print(f"[INFO] Doesn't have values for {interval}: {', '.join(indicators)}")
+            logger.info("[INFO] Doesn't have values for %s: %s", interval, ', '.join(indicators))
     
     if total_indicators_inserted > 0:
-        print(f"[INFO] Inserted {total_indicators_inserted} new economic indicator records in total")
+        logger.info("[INFO] Inserted %s new economic indicator records in total", total_indicators_inserted)
     
-    print("[EXTRACTION] Economic indicators processing completed")
+    logger.info("[EXTRACTION] Economic indicators processing completed")
     return indicators_already_available, total_indicators_inserted
 
 # ==============================================================================
 # ASSET EVENTS PROCESSING - Earnings, Dividends, Splits, Federal Funds Rate
 # ==============================================================================
 
+# Columns written for new asset events (direct COPY and staged INSERT ... SELECT)
+ASSET_EVENT_KEY_COLUMNS = '"asset_event_PK", "asset_event_ID"'
+ASSET_EVENT_DATA_COLUMNS = '"asset_event_event_pk", "asset_event_announcement_date", "asset_event_start_date", "asset_event_creator_PK", "asset_event_creation_date_time", "asset_event_last_modifier_PK", "asset_event_last_modification_date_time", "asset_event_activity_status", "asset_event_event_notes"'
+ASSET_EVENT_COLUMNS = f'{ASSET_EVENT_KEY_COLUMNS}, "asset_event_UUID", {ASSET_EVENT_DATA_COLUMNS}'
+
+# Hash of the last event batch per asset that matched the table exactly (no insert/update/delete),
+# kept per process so repeated runs with unchanged API data skip the existing-rows comparison
+_UNCHANGED_EVENT_HASHES = {}
+
+# Event API endpoints fetched for every symbol: (event_type, event_pk, api_func)
+EVENT_ENDPOINTS = (
+    ('earnings', 2, EARNINGS), ('earnings_calendar', 2, EARNINGS_CALENDAR),
+    ('dividends', 1, DIVIDENDS), ('splits', 3, STOCK_SPLITS)
+)
+
+# Stable within a process: identifies an incoming event batch by its keys and serialized notes
+def event_batch_hash(events):
+    """Hash an event batch for the unchanged-batch short-circuit"""
+    return hash(frozenset(
+        (e.get('event_pk'), e.get('announcement_date'), e.get('start_date'), dumps_notes(e.get('details', {})))
+        for e in events
+    ))
+
+# Existing events lookup for one asset schema
+EXISTING_EVENTS_SQL = 'SELECT "asset_event_PK", "asset_event_event_pk", "asset_event_announcement_date", "asset_event_start_date", "asset_event_event_notes" FROM "ASSET_{asset_symbol}".asset_events_data'
+
+# Expected -> actual earnings notes update for one asset schema (execute_values VALUES list of (PK, notes))
+EVENT_NOTES_UPDATE_SQL = 'UPDATE "ASSET_{asset_symbol}".asset_events_data AS t SET "asset_event_event_notes" = v.notes::jsonb FROM (VALUES %s) AS v(pk, notes) WHERE t."asset_event_PK" = v.pk'
+
+# Fetch existing events for an asset on a pooled connection (read-only, runs alongside the API calls)
+def fetch_existing_events(pool, asset_symbol):
+    """Read existing asset events using a connection borrowed from pool; None when the pool is exhausted
+    (batch_insert_events then reads them on the main cursor)"""
+    try:
+        conn = pool.getconn()
+    except PoolError:
+        return None
+    try:
+        with conn.cursor() as cur:
+            cur.execute(EXISTING_EVENTS_SQL.format(asset_symbol=asset_symbol))
+            return cur.fetchall()
+    finally:
+        conn.rollback()
+        pool.putconn(conn)
+
+# Submit every (endpoint, symbol) API call up front so later symbols download while earlier ones are processed
+def fetch_events_batch(executor, symbols, force_refresh=False):
+    """Return {symbol: [(event_type, event_pk, future), ...]} for all event API calls"""
+    return {
+        symbol: [(event_type, event_pk, executor.submit(api_func, symbol, force_refresh=force_refresh))
+                 for event_type, event_pk, api_func in EVENT_ENDPOINTS]
+        for symbol in symbols
+    }
+
 # Batch insert asset events with deduplication and expected->actual replacement logic
-def batch_insert_events(cursor, events, asset_symbol, assets_no_new_events=None):
+def batch_insert_events(cursor, events, asset_symbol, assets_no_new_events=None, staging=None, existing_rows=None, batch_hash=None):
     """
     Insert asset events (earnings, dividends, splits) with smart deduplication
     Replaces expected earnings with actual results when available.
     If an actual earnings event arrives that corresponds to an existing expected
     placeholder (if dates differ), the expected placeholder will be deleted.
+    If a staging list is given, the symbol's deletes, updates and a lazy generator of new rows are appended to it
+    (see flush_staged_events) instead of being written to the asset table directly; staged changes are not counted
+    in the return value.
+    existing_rows may be passed in when already fetched (see fetch_existing_events).
+    A batch identical to one that previously matched the table returns 0 immediately
+    (batch_hash may be passed in when already computed, see event_batch_hash).
     """
     if not events:
         if assets_no_new_events is not None:
             assets_no_new_events.append(asset_symbol)
         return 0
 
+    # Skip everything when this exact batch already matched the table on a previous run
+    if batch_hash is None:
+        batch_hash = event_batch_hash(events)
+    if _UNCHANGED_EVENT_HASHES.get(asset_symbol) == batch_hash:
+        return 0
+
     # Fetch existing events for this asset
-    cursor.execute(f'SELECT "asset_event_PK", "asset_event_event_pk", "asset_event_announcement_date", "asset_event_start_date", "asset_event_event_notes" FROM "ASSET_{asset_symbol}".asset_events_data')
-    existing_rows = cursor.fetchall()
+    if existing_rows is None:
+        cursor.execute(EXISTING_EVENTS_SQL.format(asset_symbol=asset_symbol))
+        existing_rows = cursor.fetchall()
 
-    existing_set = set()
+    existing_map = {}
     events_to_update = []
 
     # Helper to extract quarter/year hint from notes or dates
@@ -307,7 +500,7 @@ def batch_insert_events(cursor, events, asset_symbol, assets_no_new_events=None)
         try:
             if isinstance(notes_obj, str):
                 try:
-                    notes_obj = json.loads(notes_obj)
+                    notes_obj = orjson.loads(notes_obj)
                 except Exception:
                     notes_obj = None
             if isinstance(notes_obj, dict):
@@ -319,7 +512,7 @@ def batch_insert_events(cursor, events, asset_symbol, assets_no_new_events=None)
         if (q is None or y is None):
             d = start_date or ann_date
             if d:
-                q = f"Q{((d.month-1)//3)+1}"
+                q = QUARTER_BY_MONTH[d.month]
                 y = d.year
         return (str(q) if q else None, int(y) if isinstance(y, int) else (int(y) if isinstance(y, str) and y.isdigit() else (y.year if hasattr(y, 'year') else None)))
 
@@ -327,23 +520,24 @@ def batch_insert_events(cursor, events, asset_symbol, assets_no_new_events=None)
     expected_by_qy = {}
     expected_by_start = {}
 
-    # Build set of existing events with expected/actual flag
+    # Index existing events by key with expected/actual flag
     for row in existing_rows:
         pk, event_pk, ann_date, start_date, notes = row
-        ann_str = ann_date.strftime('%Y-%m-%d') if ann_date else ''
-        start_str = start_date.strftime('%Y-%m-%d') if start_date else ''
+        ann_str = ann_date.isoformat() if ann_date else ''
+        start_str = start_date.isoformat() if start_date else ''
         key = (event_pk, ann_str, start_str)
 
-        # Check if this is an expected earnings event
+        # Check if this is an expected earnings event (only earnings rows can be) - text notes are
+        # checked by substring so the JSON is only parsed for expected rows in _extract_qy
         is_expected = False
-        if notes:
-            try:
-                notes_dict = json.loads(notes) if isinstance(notes, str) else notes
-                is_expected = (event_pk == 2) and (('estimate' in notes_dict) or (notes_dict.get('source') == 'earnings_calendar'))
-            except Exception:
-                is_expected = (event_pk == 2) and (('earnings_calendar' in str(notes)) or ('estimate' in str(notes)))
+        if notes and event_pk == 2:
+            if isinstance(notes, dict):
+                is_expected = ('estimate' in notes) or (notes.get('source') == 'earnings_calendar')
+            else:
+                notes_str = notes if isinstance(notes, str) else str(notes)
+                is_expected = ('"estimate"' in notes_str) or ('"earnings_calendar"' in notes_str)
 
-        existing_set.add((key, pk, is_expected))
+        existing_map.setdefault(key, (pk, is_expected))
 
         if is_expected:
             q, y = _extract_qy(notes, start_date, ann_date)
@@ -359,17 +553,13 @@ def batch_insert_events(cursor, events, asset_symbol, assets_no_new_events=None)
         event_pk = e.get('event_pk')
         ann = e.get('announcement_date')
         start = e.get('start_date')
-        ann_str = ann.strftime('%Y-%m-%d') if ann else ''
-        start_str = start.strftime('%Y-%m-%d') if start else ''
+        ann_str = ann.isoformat() if ann else ''
+        start_str = start.isoformat() if start else ''
         key = (event_pk, ann_str, start_str)
         details = e.get('details', {})
 
         # Check if this event already exists
-        existing_match = None
-        for existing_key, existing_pk, is_existing_expected in existing_set:
-            if existing_key == key:
-                existing_match = (existing_pk, is_existing_expected)
-                break
+        existing_match = existing_map.get(key)
 
         if existing_match:
             existing_pk, is_existing_expected = existing_match
@@ -377,7 +567,7 @@ def batch_insert_events(cursor, events, asset_symbol, assets_no_new_events=None)
 
             # Replace expected earnings with actual results when dates fully match
             if is_existing_expected and is_new_actual:
-                notes_json = json.dumps(sanitize_for_text(details), ensure_ascii=False)
+                notes_json = dumps_notes(details)
                 events_to_update.append((existing_pk, notes_json))
             # Nothing to insert for exact match
         else:
@@ -390,10 +580,10 @@ def batch_insert_events(cursor, events, asset_symbol, assets_no_new_events=None)
                 if not (q and y):
                     # derive from dates
                     if start:
-                        q = f"Q{((start.month-1)//3)+1}"
+                        q = QUARTER_BY_MONTH[start.month]
                         y = start.year
                     elif ann:
-                        q = f"Q{((ann.month-1)//3)+1}"
+                        q = QUARTER_BY_MONTH[ann.month]
                         y = ann.year
                 # Mark any expected placeholders for deletion
                 if q and y and (q, y) in expected_by_qy:
@@ -403,55 +593,131 @@ def batch_insert_events(cursor, events, asset_symbol, assets_no_new_events=None)
             # Completely new event (keep for insertion)
             new_events.append(e)
 
+    if not new_events and not events_to_update and not expected_to_delete:
+        _UNCHANGED_EVENT_HASHES[asset_symbol] = batch_hash
+        return 0
+
+    # Without new rows the staged deletes/updates are applied by flush_staged_events as they are
+    if staging is not None and not new_events:
+        staging.append((asset_symbol, list(expected_to_delete), events_to_update, None))
+        return 0
+
     # Delete expected placeholders that correspond to newly arriving actual earnings
-    if expected_to_delete:
+    if staging is None and expected_to_delete:
         try:
             cursor.execute(f'DELETE FROM "ASSET_{asset_symbol}".asset_events_data WHERE "asset_event_PK" = ANY(%s)', (list(expected_to_delete),))
         except Exception as _del_err:
-            print(f"[WARN] Failed deleting expected placeholders for {asset_symbol}: {_del_err}")
+            logger.warning("[WARN] Failed deleting expected placeholders for %s: %s", asset_symbol, _del_err)
 
-    # Update existing events (expected -> actual) when keys matched exactly
-    for pk, notes_json in events_to_update:
-        cursor.execute(f'UPDATE "ASSET_{asset_symbol}".asset_events_data SET "asset_event_event_notes" = %s WHERE "asset_event_PK" = %s', (notes_json, pk))
+    # Update existing events (expected -> actual) when keys matched exactly, in one statement
+    if staging is None and events_to_update:
+        execute_values(cursor, EVENT_NOTES_UPDATE_SQL.format(asset_symbol=asset_symbol), events_to_update)
 
     if not new_events:
         return len(events_to_update)
 
-    # Insert completely new events using bulk COPY
-    cursor.execute(f'SELECT COALESCE(MAX("asset_event_PK"), 0) + 1, COALESCE(MAX("asset_event_ID"), 0) + 1 FROM "ASSET_{asset_symbol}".asset_events_data')
-    next_pk, next_id = cursor.fetchone()
-
-    # Prepare CSV data for bulk insert
-    output = io.StringIO()
-    for i, ev in enumerate(new_events):
-        details = ev.get('details', {})
-        sanitized_details = sanitize_for_text(details)
-        if isinstance(sanitized_details, dict) and 'source' in sanitized_details:
-            sanitized_details.pop('source', None)
-        now = datetime.now().isoformat()
-        
-        row = [
-            str(next_pk + i), str(next_id + i), str(uuid4()), str(ev['event_pk']),
-            ev['announcement_date'].strftime('%Y-%m-%d') if ev['announcement_date'] else '',
-            ev['start_date'].strftime('%Y-%m-%d') if ev['start_date'] else '',
-            '', now, '', now, '1', json.dumps(sanitized_details, ensure_ascii=False)
-        ]
-        csv.writer(output).writerow(row)
-
-    # Execute bulk insert
-    output.seek(0)
-    cursor.copy_expert(f'COPY "ASSET_{asset_symbol}".asset_events_data ("asset_event_PK", "asset_event_ID", "asset_event_UUID", "asset_event_event_pk", "asset_event_announcement_date", "asset_event_start_date", "asset_event_creator_PK", "asset_event_creation_date_time", "asset_event_last_modifier_PK", "asset_event_last_modification_date_time", "asset_event_activity_status", "asset_event_event_notes") FROM STDIN WITH (FORMAT CSV)', output)
-    
+    # Insert completely new events using bulk COPY; staged rows carry 1-based PK/ID offsets
+    # that flush_staged_events adds to the table's MAX server-side
+    if staging is not None:
+        next_pk, next_id = 1, 1
+    else:
+        cursor.execute(f'SELECT COALESCE(MAX("asset_event_PK"), 0) + 1, COALESCE(MAX("asset_event_ID"), 0) + 1 FROM "ASSET_{asset_symbol}".asset_events_data')
+        next_pk, next_id = cursor.fetchone()
+
+    # Prepare COPY TEXT rows lazily for bulk insert (\N is NULL in TEXT format)
+    now = datetime.now().isoformat()
+    audit_cols = f'\\N\t{now}\t\\N\t{now}\t1'
+    def event_rows():
+        for i, ev in enumerate(new_events):
+            details = ev.get('details', {})
+            if isinstance(details, dict) and 'source' in details:
+                details = {k: v for k, v in details.items() if k != 'source'}
+
+            yield f'{next_pk + i}\t{next_id + i}', _format_event_row(
+                ev['event_pk'], ev['announcement_date'], ev['start_date'], audit_cols, dumps_notes(details)
+            )
+
+    # Stage the row generator for the cross-symbol load (rows are built while the COPY reads them,
+    # UUID generated server-side), or stream the rows straight into COPY
+    if staging is not None:
+        rows = (f'{asset_symbol}\t{key}\t{data}\n' for key, data in event_rows())
+        staging.append((asset_symbol, list(expected_to_delete), events_to_update, rows))
+        # Staged changes are counted by flush_staged_events once actually written
+        return 0
+    else:
+        # gc is paused while the rows are built: every row allocates dicts/strings that can trigger mid-loop collections
+        with gc_disabled():
+            output = IteratorFile(f'{key}\t{uuid4()}\t{data}\n' for key, data in event_rows())
+            cursor.copy_expert(f'COPY "ASSET_{asset_symbol}".asset_events_data ({ASSET_EVENT_COLUMNS}) FROM STDIN', output)
+
     return len(new_events) + len(events_to_update)
 
+# Load events staged by batch_insert_events: one COPY into a temp table, then per asset schema the
+# placeholder DELETE, notes UPDATE and INSERT ... SELECT in one savepoint
+def flush_staged_events(cursor, staging):
+    """
+    Bulk load staged asset events into their "ASSET_<symbol>" tables
+    staging holds (symbol, delete_pks, updates, rows) per asset; rows is None when nothing is inserted.
+    The temp table copies column types from ASSET_TEMPLATE and is dropped on commit.
+    PK/ID are assigned in the INSERT as the table's current MAX plus the staged offset,
+    and the UUID by gen_random_uuid(); a concurrent writer taking the same keys fails that schema,
+    and its deletes and updates are rolled back with the insert.
+    Returns (inserted, federal_funds_inserted, failed) - inserted and updated row counts actually written and
+    a list of (symbol, error) for schemas whose changes failed.
+    """
+    inserted, federal_funds_inserted, failed = 0, 0, []
+    if not staging:
+        return inserted, federal_funds_inserted, failed
+
+    # Rows of all symbols are generated lazily as COPY reads them; gc is paused while they are built
+    if any(rows is not None for *_, rows in staging):
+        cursor.execute('CREATE TEMP TABLE IF NOT EXISTS staged_asset_events (LIKE "ASSET_TEMPLATE".asset_events_data) ON COMMIT DROP')
+        cursor.execute('ALTER TABLE staged_asset_events ADD COLUMN IF NOT EXISTS staged_symbol text, ALTER COLUMN "asset_event_UUID" DROP NOT NULL')
+        cursor.execute('TRUNCATE staged_asset_events')
+        with gc_disabled():
+            output = IteratorFile(chain.from_iterable(rows for *_, rows in staging if rows is not None))
+            cursor.copy_expert(f'COPY staged_asset_events (staged_symbol, {ASSET_EVENT_KEY_COLUMNS}, {ASSET_EVENT_DATA_COLUMNS}) FROM STDIN', output)
+
+    for symbol, delete_pks, updates, rows in staging:
+        cursor.execute('SAVEPOINT staged_events_sp')
+        event_pks = []
+        try:
+            if delete_pks:
+                cursor.execute(f'DELETE FROM "ASSET_{symbol}".asset_events_data WHERE "asset_event_PK" = ANY(%s)', (delete_pks,))
+            if updates:
+                execute_values(cursor, EVENT_NOTES_UPDATE_SQL.format(asset_symbol=symbol), updates)
+            if rows is not None:
+                cursor.execute(f'''INSERT INTO "ASSET_{symbol}".asset_events_data ({ASSET_EVENT_COLUMNS})
+                                  SELECT m.max_pk + s."asset_event_PK", m.max_id + s."asset_event_ID", gen_random_uuid(), {ASSET_EVENT_DATA_COLUMNS}
+                                  FROM staged_asset_events s
+                                  CROSS JOIN (SELECT COALESCE(MAX("asset_event_PK"), 0) AS max_pk, COALESCE(MAX("asset_event_ID"), 0) AS max_id
+                                              FROM "ASSET_{symbol}".asset_events_data) m
+                                  WHERE s.staged_symbol = %s
+                                  RETURNING "asset_event_event_pk"''', (symbol,))
+                event_pks = [r[0] for r in cursor.fetchall()]
+            cursor.execute('RELEASE SAVEPOINT staged_events_sp')
+        except Exception as e:
+            cursor.execute('ROLLBACK TO SAVEPOINT staged_events_sp')
+            failed.append((symbol, e))
+            continue
+        inserted += len(event_pks) + len(updates)
+        federal_funds_inserted += event_pks.count(4)
+    return inserted, federal_funds_inserted, failed
+
 # Main function to process all asset events (earnings, dividends, splits, federal funds)
-def process_events(cursor, only_symbols=None):
+def process_events(cursor, only_symbols=None, pool=None, force_refresh=False):
     """
     Extract, transform and load asset events data
     Handles: Earnings reports, dividends, stock splits, federal funds rate
     Optionally limits processing to only_symbols (list of uppercase tickers)
+    Optional pool (ThreadedConnectionPool) is used to read existing events in parallel with API calls;
+    all writes stay on cursor's connection; force_refresh bypasses the API response cache
     """
-    print("\n[EXTRACTION] Starting asset events processing...")
+    logger.info("[EXTRACTION] Starting asset events processing...")
+
+    # A forced refresh re-diffs every asset, picking up out-of-band edits to asset_events_data
+    if force_refresh:
+        _UNCHANGED_EVENT_HASHES.clear()
     
     # Get all available asset schemas and symbols
     cursor.execute('SELECT schema_name FROM information_schema.schemata WHERE schema_name LIKE \'ASSET_%\' AND schema_name != \'ASSET_TEMPLATE\' AND schema_name NOT LIKE \'%=%\' AND schema_name NOT LIKE \'%.%\' AND schema_name NOT LIKE \'%-%\' ORDER BY schema_name')
@@ -467,17 +733,22 @@ def process_events(cursor, only_symbols=None):
     if only_symbols:
         only_set = set(s.upper() for s in only_symbols)
         us_symbols = [s for s in us_symbols if s in only_set]
-        print(f"[INFO] Limiting processing to symbols: {', '.join(us_symbols) if us_symbols else '(none)'}")
+        logger.info("[INFO] Limiting processing to symbols: %s", ', '.join(us_symbols) if us_symbols else '(none)')
+
+    # Asset schemas whose events table is accessible (information_schema only lists tables we have privileges on)
+    cursor.execute("SELECT table_schema FROM information_schema.tables WHERE table_schema LIKE 'ASSET_%' AND table_name = 'asset_events_data'")
+    accessible_schemas = {r[0] for r in cursor.fetchall()}
 
     assets_no_new_events, symbols_with_warnings = [], []
+    staging = []
     total_events_inserted, events_count, last_reported = 0, 0, 0
     total_federal_funds_inserted = 0
 
     # Fetch federal funds rate data (applies to all assets)
     federal_funds_rates = []
     try:
-        print("[INFO] Fetching federal funds rate data...")
-        ff_resp = FEDERAL_FUNDS_RATE('monthly')
+        logger.info("[INFO] Fetching federal funds rate data...")
+        ff_resp = FEDERAL_FUNDS_RATE('monthly', force_refresh=force_refresh)
         if isinstance(ff_resp, dict):
             parsed = []
             ff_data = ff_resp.get('data')
@@ -498,7 +769,10 @@ def process_events(cursor, only_symbols=None):
                     if isinstance(ts, dict):
                         for date_str, rec in ts.items():
                             if isinstance(rec, dict):
-                                val = next((v for v in rec.values() if isinstance(v, (str, int, float)) and str(v) not in ('', '.')), None)
+                                # Alpha Vantage uses a 'value' key; scan other fields only when it's missing
+                                val = rec.get('value', rec.get('Value'))
+                                if val is None:
+                                    val = next((v for v in rec.values() if isinstance(v, (str, int, float)) and v not in ('', '.')), None)
                             else:
                                 val = rec
                             
@@ -519,125 +793,107 @@ def process_events(cursor, only_symbols=None):
                         break
             
             if parsed:
-                # Keep only recent 12 months of data
-                parsed = sorted({(d, v) for d, v in parsed}, key=lambda x: x[0], reverse=True)
-                federal_funds_rates = parsed[:12]
-                print(f"[INFO] Processed {len(federal_funds_rates)} Federal Funds Rate records")
+                # Keep only recent 12 months of data (partial selection instead of a full sort)
+                federal_funds_rates = heapq.nlargest(12, set(parsed), key=lambda x: x[0])
+                logger.info("[INFO] Processed %s Federal Funds Rate records", len(federal_funds_rates))
     except Exception as e:
-        print(f"[WARN] Exception fetching FEDERAL_FUNDS_RATE: {e}")
+        logger.warning("[WARN] Exception fetching FEDERAL_FUNDS_RATE: %s", e)
 
-    # Process each asset symbol
+    # Verify table access
     for symbol in us_symbols:
-        # Verify table access
-        try:
-            cursor.execute(f'SELECT COUNT(*) FROM "ASSET_{symbol}".asset_events_data')
-            cursor.fetchone()[0]
-        except Exception as e:
-            print(f"[ERROR] Cannot access table for {symbol}: {e}")
-            continue
-        
-        all_events, warnings = [], []
+        if f"ASSET_{symbol}" not in accessible_schemas:
+            logger.error("[ERROR] Cannot access table for %s: asset_events_data not found or not accessible", symbol)
+    accessible_symbols = [s for s in us_symbols if f"ASSET_{s}" in accessible_schemas]
 
-        # Fetch different types of events for this symbol
-        for event_type, event_pk, api_func in [
-            ('earnings', 2, EARNINGS), ('earnings_calendar', 2, EARNINGS_CALENDAR), 
-            ('dividends', 1, DIVIDENDS), ('splits', 3, STOCK_SPLITS)
-        ]:
-            try:
-                resp = api_func(symbol)
+    # Process each asset symbol - the event API calls for all symbols are queued at once on a bounded
+    # worker pool, and the existing-events read (when a pool is given) runs alongside; DB writes stay on this thread
+    with ThreadPoolExecutor(max_workers=8) as api_executor, ThreadPoolExecutor(max_workers=2) as db_executor:
+        event_futures = fetch_events_batch(api_executor, accessible_symbols, force_refresh)
+        for symbol in accessible_symbols:
+            all_events, warnings = [], []
+
+            # Read existing events alongside the API responses only for symbols without an unchanged-batch
+            # hash; otherwise the read is deferred until the batch is known to differ
+            speculative = pool is not None and symbol not in _UNCHANGED_EVENT_HASHES
+            existing_future = db_executor.submit(fetch_existing_events, pool, symbol) if speculative else None
+            for event_type, event_pk, future in event_futures.pop(symbol):
+                try:
+                    resp = future.result()
                 
-                # Validate API response
-                if not isinstance(resp, dict) or "status" not in resp or resp.get("status") != 200 or "data" not in resp:
-                    warnings.append(f"Invalid or failed response for {event_type}")
-                    continue
+                    # Validate API response
+                    if not isinstance(resp, dict) or "status" not in resp or resp.get("status") != 200 or "data" not in resp:
+                        warnings.append(f"Invalid or failed response for {event_type}")
+                        continue
                     
-                data = resp["data"]
-                
-                # Check for API errors
-                if isinstance(data, dict) and "error" in data:
-                    warnings.append(f"API error for {event_type}: {data['error']}")
-                    continue
+                    data = resp["data"]
                 
-                # Process different event types
-                if event_type == 'earnings':
-                    # Historical earnings reports
-                    if data.get("symbol") and data.get("symbol").upper() != symbol:
-                        warnings.append(f"Symbol mismatch in {event_type}: expected {symbol}, got {data.get('symbol')}")
+                    # Check for API errors
+                    if isinstance(data, dict) and "error" in data:
+                        warnings.append(f"API error for {event_type}: {data['error']}")
                         continue
-                    for e in data.get('quarterlyEarnings', []):
-                        fiscal = parse_date(e.get('fiscalDateEnding'))
-                        reported = parse_date(e.get('reportedDate'))
-                        if fiscal and reported and reported >= fiscal:
-                            quarter = get_quarter_from_date(e.get('fiscalDateEnding'))
-                            year = fiscal.year if fiscal else None
-                            all_events.append({
-                                'event_pk': event_pk,
-                                'announcement_date': fiscal,
-                                'start_date': reported,
-                                'details': {'quarter': quarter, 'year': year}
-                            })
+                
+                    # Process different event types
+                    if event_type == 'earnings':
+                        # Historical earnings reports
+                        if data.get("symbol") and data.get("symbol").upper() != symbol:
+                            warnings.append(f"Symbol mismatch in {event_type}: expected {symbol}, got {data.get('symbol')}")
+                            continue
+                        for e in data.get('quarterlyEarnings', []):
+                            fiscal = parse_date(e.get('fiscalDateEnding'))
+                            reported = parse_date(e.get('reportedDate'))
+                            if fiscal and reported and reported >= fiscal:
+                                quarter = get_quarter_from_date(e.get('fiscalDateEnding'))
+                                year = fiscal.year if fiscal else None
+                                all_events.append({
+                                    'event_pk': event_pk,
+                                    'announcement_date': fiscal,
+                                    'start_date': reported,
+                                    'details': {'quarter': quarter, 'year': year}
+                                })
                             
-                elif event_type == 'earnings_calendar':
-                    # Future earnings estimates/calendar
-                    calendar_data = data
+                    elif event_type == 'earnings_calendar':
+                        # Future earnings estimates/calendar
+                        calendar_data = data
                     
-                    if isinstance(calendar_data, str):
-                        # Handle CSV string format
-                        lines = calendar_data.strip().split('\n')
-                        if len(lines) > 1:
-                            headers = [h.strip() for h in lines[0].split(',')]
-                            symbol_index = next((i for i, h in enumerate(headers) if 'symbol' in h.lower()), None)
-                            date_index = next((i for i, h in enumerate(headers) if 'reportdate' in h.lower() or 'date' in h.lower()), None)
-                            fiscal_index = next((i for i, h in enumerate(headers) if 'fiscal' in h.lower()), None)
-                            estimate_index = next((i for i, h in enumerate(headers) if 'estimate' in h.lower()), None)
+                        if isinstance(calendar_data, str):
+                            # Handle CSV string format
+                            reader = csv.reader(io.StringIO(calendar_data.strip()))
+                            headers = [h.strip() for h in next(reader, [])]
+                            if headers:
+                                symbol_index = next((i for i, h in enumerate(headers) if 'symbol' in h.lower()), None)
+                                date_index = next((i for i, h in enumerate(headers) if 'reportdate' in h.lower() or 'date' in h.lower()), None)
+                                fiscal_index = next((i for i, h in enumerate(headers) if 'fiscal' in h.lower()), None)
+                                estimate_index = next((i for i, h in enumerate(headers) if 'estimate' in h.lower()), None)
                             
-                            if symbol_index is not None and date_index is not None:
-                                for line in lines[1:]:
-                                    cols = [c.strip() for c in line.split(',')]
-                                    if len(cols) > max(symbol_index, date_index):
-                                        line_symbol = cols[symbol_index]
-                                        if line_symbol == symbol:
-                                            earnings_date = parse_date(cols[date_index])
-                                            fiscal_date = parse_date(cols[fiscal_index]) if fiscal_index and len(cols) > fiscal_index else None
-                                            estimate = cols[estimate_index] if estimate_index and len(cols) > estimate_index else None
+                                if symbol_index is not None and date_index is not None:
+                                    for cols in reader:
+                                        if len(cols) > max(symbol_index, date_index):
+                                            line_symbol = cols[symbol_index].strip()
+                                            if line_symbol == symbol:
+                                                cols = [c.strip() for c in cols]
+                                                earnings_date = parse_date(cols[date_index])
+                                                fiscal_date = parse_date(cols[fiscal_index]) if fiscal_index and len(cols) > fiscal_index else None
+                                                estimate = cols[estimate_index] if estimate_index and len(cols) > estimate_index else None
                                             
-                                            if earnings_date:
-                                                use_date = fiscal_date or earnings_date
-                                                quarter = get_quarter_from_date(use_date.strftime('%Y-%m-%d')) if isinstance(use_date, type(datetime.now().date())) else get_quarter_from_date(cols[fiscal_index] if fiscal_index and len(cols) > fiscal_index else cols[date_index])
-                                                year = use_date.year if isinstance(use_date, type(datetime.now().date())) else None
-                                                all_events.append({
-                                                    'event_pk': event_pk,
-                                                    'announcement_date': fiscal_date,
-                                                    'start_date': earnings_date,
-                                                    'details': {'quarter': quarter, 'year': year, 'estimate': estimate}
-                                                })
+                                                if earnings_date:
+                                                    use_date = fiscal_date or earnings_date
+                                                    quarter = get_quarter_from_date(use_date.isoformat()) if isinstance(use_date, type(datetime.now().date())) else get_quarter_from_date(cols[fiscal_index] if fiscal_index and len(cols) > fiscal_index else cols[date_index])
+                                                    year = use_date.year if isinstance(use_date, type(datetime.now().date())) else None
+                                                    all_events.append({
+                                                        'event_pk': event_pk,
+                                                        'announcement_date': fiscal_date,
+                                                        'start_date': earnings_date,
+                                                        'details': {'quarter': quarter, 'year': year, 'estimate': estimate}
+                                                    })
                                                 
-                    elif isinstance(calendar_data, list):
-                        # Handle list format
-                        for e in calendar_data:
-                            earnings_date = parse_date(e.get('reportDate') or e.get('date'))
-                            earnings_calendar_fiscal = parse_date(e.get('fiscalDateEnding'))
-                            if earnings_date:
-                                use_date = earnings_calendar_fiscal or earnings_date
-                                quarter = get_quarter_from_date(use_date.strftime('%Y-%m-%d')) if use_date else None
-                                year = use_date.year if use_date else None
-                                all_events.append({
-                                    'event_pk': event_pk,
-                                    'announcement_date': earnings_calendar_fiscal,
-                                    'start_date': earnings_date,
-                                    'details': {'quarter': quarter, 'year': year, 'estimate': e.get('estimate')}
-                                })
-                                
-                    elif isinstance(calendar_data, dict):
-                        # Handle nested dictionary format
-                        inner_data = calendar_data.get('data', [])
-                        if isinstance(inner_data, list):
-                            for e in inner_data:
+                        elif isinstance(calendar_data, list):
+                            # Handle list format
+                            for e in calendar_data:
                                 earnings_date = parse_date(e.get('reportDate') or e.get('date'))
                                 earnings_calendar_fiscal = parse_date(e.get('fiscalDateEnding'))
                                 if earnings_date:
                                     use_date = earnings_calendar_fiscal or earnings_date
-                                    quarter = get_quarter_from_date(use_date.strftime('%Y-%m-%d')) if use_date else None
+                                    quarter = get_quarter_from_date(use_date.isoformat()) if use_date else None
                                     year = use_date.year if use_date else None
                                     all_events.append({
                                         'event_pk': event_pk,
@@ -645,111 +901,185 @@ def process_events(cursor, only_symbols=None):
                                         'start_date': earnings_date,
                                         'details': {'quarter': quarter, 'year': year, 'estimate': e.get('estimate')}
                                     })
+                                
+                        elif isinstance(calendar_data, dict):
+                            # Handle nested dictionary format
+                            inner_data = calendar_data.get('data', [])
+                            if isinstance(inner_data, list):
+                                for e in inner_data:
+                                    earnings_date = parse_date(e.get('reportDate') or e.get('date'))
+                                    earnings_calendar_fiscal = parse_date(e.get('fiscalDateEnding'))
+                                    if earnings_date:
+                                        use_date = earnings_calendar_fiscal or earnings_date
+                                        quarter = get_quarter_from_date(use_date.isoformat()) if use_date else None
+                                        year = use_date.year if use_date else None
+                                        all_events.append({
+                                            'event_pk': event_pk,
+                                            'announcement_date': earnings_calendar_fiscal,
+                                            'start_date': earnings_date,
+                                            'details': {'quarter': quarter, 'year': year, 'estimate': e.get('estimate')}
+                                        })
                             
-                elif event_type == 'dividends':
-                    # Dividend payments
-                    for d in data.get('data', []):
-                        ex_date = parse_date(d.get('ex_dividend_date'))
-                        if ex_date:
-                            amount = d.get('dividend_amount') or d.get('dividend') or d.get('amount') or d.get('value')
-                            all_events.append({
-                                'event_pk': event_pk,
-                                'announcement_date': ex_date,
-                                'start_date': parse_date(d.get('payment_date')) or ex_date,
-                                'details': {'dividend_amount': amount}
-                            })
+                    elif event_type == 'dividends':
+                        # Dividend payments
+                        for d in data.get('data', []):
+                            ex_date = parse_date(d.get('ex_dividend_date'))
+                            if ex_date:
+                                amount = d.get('dividend_amount') or d.get('dividend') or d.get('amount') or d.get('value')
+                                all_events.append({
+                                    'event_pk': event_pk,
+                                    'announcement_date': ex_date,
+                                    'start_date': parse_date(d.get('payment_date')) or ex_date,
+                                    'details': {'dividend_amount': amount}
+                                })
                             
-                elif event_type == 'splits':
-                    # Stock splits
-                    for s in data.get('data', []):
-                        eff = parse_date(s.get('effective_date'))
-                        if eff:
-                            factor = (s.get('split_factor') or s.get('split_coefficient') or 
-                                    s.get('split_ratio') or s.get('splitFactor') or s.get('factor'))
-                            all_events.append({
-                                'event_pk': event_pk,
-                                'announcement_date': eff,
-                                'start_date': eff,
-                                'details': {'split_ratio': compute_split_ratio_str(factor)}
-                            })
+                    elif event_type == 'splits':
+                        # Stock splits
+                        for s in data.get('data', []):
+                            eff = parse_date(s.get('effective_date'))
+                            if eff:
+                                factor = (s.get('split_factor') or s.get('split_coefficient') or 
+                                        s.get('split_ratio') or s.get('splitFactor') or s.get('factor'))
+                                all_events.append({
+                                    'event_pk': event_pk,
+                                    'announcement_date': eff,
+                                    'start_date': eff,
+                                    'details': {'split_ratio': compute_split_ratio_str(factor)}
+                                })
                     
-            except Exception as e:
-                warnings.append(f"Exception getting {event_type}: {e}")
-
-        # Add federal funds rate events to all assets
-        if federal_funds_rates:
-            for date, value in federal_funds_rates:
-                all_events.append({
-                    'event_pk': 4,
-                    'announcement_date': date,
-                    'start_date': date,
-                    'details': {'fvalue': value}
-                })
-
-        # Track progress across all events
-        events_count += len(all_events)
-        if events_count // 1000 > last_reported:
-            last_reported = events_count // 1000
-            print(f"[INFO] Processed {last_reported * 1000} events so far")
-
-        # Sort and insert events if any exist
-        if all_events:
-            # Sort events by date and type (actual earnings before expected)
-            def sort_key(event):
-                date = event.get('announcement_date')
-                event_pk = event.get('event_pk', 0)
-                date_sort = date.strftime('%Y-%m-%d') if date else '9999-12-31'
-                type_priority = event_pk
-                if event_pk == 2:
-                    details = event.get('details', {})
-                    if details and details.get('estimate') is None:
-                        type_priority = 2.1  # Actual earnings first
-                    else:
-                        type_priority = 2.2  # Expected earnings second
-                return (date_sort, type_priority)
+                except Exception as e:
+                    warnings.append(f"Exception getting {event_type}: {e}")
+
+            # Add federal funds rate events to all assets
+            if federal_funds_rates:
+                for event_date, value in federal_funds_rates:
+                    all_events.append({
+                        'event_pk': 4,
+                        'announcement_date': event_date,
+                        'start_date': event_date,
+                        'details': {'fvalue': value}
+                    })
+
+            # Track progress across all events
+            events_count += len(all_events)
+            if events_count // 1000 > last_reported:
+                last_reported = events_count // 1000
+                logger.info("[INFO] Processed %s events so far", last_reported * 1000)
+
+            # Sort and insert events if any exist
+            if all_events:
+                # Sort events by date and type (actual earnings before expected)
+                def sort_key(event):
+                    event_date = event.get('announcement_date')
+                    event_pk = event.get('event_pk', 0)
+                    date_sort = event_date.isoformat() if event_date else '9999-12-31'
+                    type_priority = event_pk
+                    if event_pk == 2:
+                        details = event.get('details', {})
+                        if details and details.get('estimate') is None:
+                            type_priority = 2.1  # Actual earnings first
+                        else:
+                            type_priority = 2.2  # Expected earnings second
+                    return (date_sort, type_priority)
             
-            all_events.sort(key=sort_key)
+                all_events.sort(key=sort_key)
             
-            # Insert events into database
-            try:
-                inserted = batch_insert_events(cursor, all_events, symbol)
-                total_events_inserted += inserted
-                ff_events_count = len([e for e in all_events if e.get('event_pk') == 4])
-                total_federal_funds_inserted += ff_events_count if inserted > 0 else 0
-            except Exception as e:
-                warnings.append(f"Failed to insert events: {e}")
-        else:
-            # No events for this symbol
-            batch_insert_events(cursor, [], symbol, assets_no_new_events)
+                # Insert events into database
+                try:
+                    # Unchanged since a previous run that matched the table: skip the existing-rows read and diff
+                    batch_hash = event_batch_hash(all_events)
+                    if _UNCHANGED_EVENT_HASHES.get(symbol) != batch_hash:
+                        # None (no speculative read, or pool exhausted) reads on the main cursor
+                        existing_rows = existing_future.result() if existing_future is not None else None
+                        inserted = batch_insert_events(cursor, all_events, symbol, staging=staging, existing_rows=existing_rows, batch_hash=batch_hash)
+                        total_events_inserted += inserted
+                except Exception as e:
+                    warnings.append(f"Failed to insert events: {e}")
+            else:
+                # No events for this symbol
+                batch_insert_events(cursor, [], symbol, assets_no_new_events)
+
+            # Track any warnings for this symbol
+            if warnings:
+                symbols_with_warnings.append((symbol, warnings))
 
-        # Track any warnings for this symbol
-        if warnings:
-            symbols_with_warnings.append((symbol, warnings))
+    # Load new events for all symbols in one staged COPY; totals count only the rows it wrote
+    staged_inserted, staged_federal_funds, failed = flush_staged_events(cursor, staging)
+    total_events_inserted += staged_inserted
+    total_federal_funds_inserted += staged_federal_funds
+    for symbol, e in failed:
+        logger.warning("[WARN] Failed to write staged events for %s: %s", symbol, e)
+        symbols_with_warnings.append((symbol, [f"Failed to insert events: {e}"]))
 
     # Print final summary
     if total_events_inserted > 0:
-        print(f"[INFO] Inserted {total_events_inserted} new events in total for all assets")
+        logger.info("[INFO] Inserted %s new events in total for all assets", total_events_inserted)
     else:
         if events_count == 0:
-            print("[INFO] No events processed for any asset")
+            logger.info("[INFO] No events processed for any asset")
         else:
-            print("[INFO] No new events to insert for any asset - all data already available")
+            logger.info("[INFO] No new events to insert for any asset - all data already available")
     
     if total_federal_funds_inserted > 0:
-        print(f"[INFO] Inserted {total_federal_funds_inserted} federal funds rate events in total for all assets")
+        logger.info("[INFO] Inserted %s federal funds rate events in total for all assets", total_federal_funds_inserted)
     elif federal_funds_rates:
-        print("[INFO] Federal funds rate data is already available in database for all assets")
+        logger.info("[INFO] Federal funds rate data is already available in database for all assets")
     
-    print("[EXTRACTION] Asset events processing completed")
+    logger.info("[EXTRACTION] Asset events processing completed")
     return total_events_inserted
 
 
+# ==============================================================================
+# ETL CONFIGURATION - Indicators, intervals and fill plan (built once at import time)
+# ==============================================================================
+
+# Economic indicators and their supported intervals
+_INTERVAL_LIST = ('daily', 'weekly', 'monthly', 'semiannual', 'quarterly', 'annual')
+_INTERVAL_DICT = MappingProxyType({
+    'real_GDP_interval_list': ('quarterly', 'annual'),
+    'real_GDP_pc_interval_list': ('quarterly',),
+    'Federal_funds_interval_list': ('daily', 'weekly', 'monthly'),
+    'Treasury_yield_interval_list': ('daily', 'weekly', 'monthly'),
+    'CPI_interval_list': ('monthly', 'semiannual'),
+    'inflation_interval_list': ('annual',),
+    'retail_sales_interval_list': ('monthly',),
+    'durables_interval_list': ('monthly',),
+    'unemployment_interval_list': ('monthly',),
+    'nonfarm_payrolls_interval_list': ('monthly',)
+})
+
+# Indicator columns that get forward/backward filled
+_FILL_MAP = MappingProxyType({
+    'Treasury_yield_interval_list': 'TCMRP_value',
+    'Federal_funds_interval_list': 'EFFRP_value',
+    'CPI_interval_list': 'CPIAUC_value',
+    'inflation_interval_list': 'ICPP_value',
+    'retail_sales_interval_list': 'ARSRTMUSD_value',
+    'durables_interval_list': 'MNODGMUSD_value',
+    'unemployment_interval_list': 'URP_value',
+    'nonfarm_payrolls_interval_list': 'TNPTP_value',
+    'real_GDP_interval_list': 'RGDPBUSD_value',
+    'real_GDP_pc_interval_list': 'RGDPCBUSD_value'
+})
+
+# Database column prefixes for different time intervals
+_PREFIX_MAP = MappingProxyType({'daily': 'D', 'weekly': 'W', 'monthly': 'M', 'quarterly': 'Q', 'semiannual': 'SA', 'annual': 'A'})
+
+# Fill plan: (interval, table, filled columns) - all filled columns of a table are handled by one UPDATE
+_FILL_PLAN = tuple(
+    (interval, f'"dyGEO".{interval}_economic_indicator_log', columns)
+    for interval in _INTERVAL_LIST
+    for columns in [tuple(_PREFIX_MAP[interval] + _FILL_MAP[indicator] for indicator, intervals in _INTERVAL_DICT.items()
+                          if interval in intervals and indicator in _FILL_MAP)]
+    if columns
+)
+
 # ==============================================================================
 # MAIN ETL FUNCTION - Entry Point for Economic Indicators Extractor
 # ==============================================================================
 
 # Main ETL resolver function - orchestrates the entire data extraction process
-def resolve_EIE(_, info, tickers_list=None):
+def resolve_EIE(_, info, tickers_list=None, force_refresh=False, skip_indicators=False):
     """
     Main Economic Indicators Extractor function
     
@@ -758,156 +1088,128 @@ def resolve_EIE(_, info, tickers_list=None):
     LOADING: Inserts/updates data in PostgreSQL database with deduplication
     
     Optional: tickers_list to limit processing to specific symbols
+    Optional: force_refresh to bypass the API response cache
+    Optional: skip_indicators to run only the asset events step (e.g. for all but one of several ticker batches)
     
     Returns: Success/error status with processing statistics
     """
+    pg_pool = conn = None
     try:
-        print("\n" + "="*80)
-        print("ECONOMIC INDICATORS EXTRACTOR BOT - STARTING ETL PROCESS")
-        print("="*80)
-        
-        # Import settings
-        from settings import DBNAME, DATABASE_HOST, USER, PASSWORD, DATABASE_PORT
+        logger.info("=" * 80)
+        logger.info("ECONOMIC INDICATORS EXTRACTOR BOT - STARTING ETL PROCESS")
+        logger.info("=" * 80)
         
-        # Database connection configuration
-        connection_params = {
-            "host": DATABASE_HOST,
-            "port": DATABASE_PORT,
-            "user": USER,
-            "password": PASSWORD,
-            "database": DBNAME
-        }
-
-        # Database connection with retry logic
-        def connect_with_retries(retries=5, delay=5):
-            """Attempt database connection with exponential backoff"""
+        # Borrow a pooled database connection with retry logic
+        def connect_with_retries(retries=5, delay=0.2):
+            """Attempt to acquire a pooled database connection with jittered exponential backoff"""
+            # 0.2s, 0.4s, 0.8s, 1.6s ... each +/-30% so concurrent workers don't retry in lockstep
+            delays = [delay * (2 ** i) * (1 + random.uniform(-0.3, 0.3)) for i in range(retries)]
             for attempt in range(retries):
                 try:
-                    conn = psycopg2.connect(**connection_params)
+                    pooled = get_pg_pool()
+                    conn = pooled.getconn()
                     conn.autocommit = False
-                    print(f"[DB] Connected successfully on attempt {attempt + 1}")
-                    return conn
+                    logger.info("[DB] Connected successfully on attempt %s", attempt + 1)
+                    return pooled, conn
                 except Exception as e:
-                    print(f"[ERROR] DB connection attempt {attempt + 1} failed: {e}")
+                    logger.error("[ERROR] DB connection attempt %s failed: %s", attempt + 1, e)
                     if attempt < retries - 1:
-                        time_module.sleep(delay)
-            print("[ERROR] All database connection attempts failed")
-            return None
+                        time_module.sleep(delays[attempt])
+            logger.error("[ERROR] All database connection attempts failed")
+            return None, None
 
-        conn = connect_with_retries()
+        pg_pool, conn = connect_with_retries()
         if conn is None:
             return {'success': False, 'error': 'Database connection failed'}
             
         cursor = conn.cursor()
-        print("[DB] Database cursor established")
+        logger.info("[DB] Database cursor established")
         
         # Normalize tickers_list from GraphQL (can be list or JSON string)
         only_symbols = None
         if tickers_list:
             if isinstance(tickers_list, str):
                 try:
-                    parsed = json.loads(tickers_list)
+                    parsed = orjson.loads(tickers_list)
                 except Exception:
                     parsed = None
             else:
                 parsed = tickers_list
             if isinstance(parsed, list):
                 only_symbols = [str(x).upper() for x in parsed if x]
-                print(f"[INFO] Received tickers_list: {only_symbols}")
+                logger.info("[INFO] Received tickers_list: %s", only_symbols)
         
-        # Configure economic indicators and their supported intervals
-        interval_list = ['daily', 'weekly', 'monthly', 'semiannual', 'quarterly', 'annual']
-        interval_dict = {
-            'real_GDP_interval_list': ['quarterly', 'annual'],
-            'real_GDP_pc_interval_list': ['quarterly'],
-            'Federal_funds_interval_list': ['daily', 'weekly', 'monthly'],
-            'Treasury_yield_interval_list': ['daily', 'weekly', 'monthly'],
-            'CPI_interval_list': ['monthly', 'semiannual'],
-            'inflation_interval_list': ['annual'],
-            'retail_sales_interval_list': ['monthly'],
-            'durables_interval_list': ['monthly'],
-            'unemployment_interval_list': ['monthly'],
-            'nonfarm_payrolls_interval_list': ['monthly']
-        }
-
         # ==============================================================================
         # STEP 1: PROCESS ECONOMIC INDICATORS
         # ==============================================================================
-        try:
-            indicators_already_available, total_indicators_inserted = process_economic_indicators(
-                cursor, interval_list, interval_dict.items(), set(), set())
-        except Exception as e:
-            print(f"[ERROR] Exception in process_economic_indicators: {e}")
-            # Continue with events processing even if indicators fail
+        if skip_indicators:
+            logger.info("[INFO] skip_indicators set - economic indicators and fill step skipped")
             indicators_already_available, total_indicators_inserted = [], 0
+        else:
+            try:
+                indicators_already_available, total_indicators_inserted = process_economic_indicators(
+                    cursor, _INTERVAL_LIST, _INTERVAL_DICT.items(), set(), set(), force_refresh)
+            except Exception as e:
+                logger.error("[ERROR] Exception in process_economic_indicators: %s", e)
+                # Discard the failed interval's uncommitted work so the transaction is usable again,
+                # then continue with the fill step and events processing
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+                indicators_already_available, total_indicators_inserted = [], 0
         
-        # ==============================================================================
-        # STEP 2: FORWARD/BACKWARD FILL MISSING VALUES
-        # ==============================================================================
-        fill_map = {
-            'Treasury_yield_interval_list': 'TCMRP_value',
-            'Federal_funds_interval_list': 'EFFRP_value',
-            'CPI_interval_list': 'CPIAUC_value',
-            'inflation_interval_list': 'ICPP_value',
-            'retail_sales_interval_list': 'ARSRTMUSD_value',
-            'durables_interval_list': 'MNODGMUSD_value',
-            'unemployment_interval_list': 'URP_value',
-            'nonfarm_payrolls_interval_list': 'TNPTP_value',
-            'real_GDP_interval_list': 'RGDPBUSD_value',
-            'real_GDP_pc_interval_list': 'RGDPCBUSD_value'
-        }
-        prefix_map = {'daily': 'D', 'weekly': 'W', 'monthly': 'M', 'quarterly': 'Q', 'semiannual': 'SA', 'annual': 'A'}
-        
-        print("\n[TRANSFORMATION] Applying forward/backward fill for missing values...")
-        for interval in interval_list:
-            for indicator, intervals in interval_dict.items():
-                if interval in intervals and indicator in fill_map:
-                    column_name = prefix_map[interval] + fill_map[indicator]
-                    table_name = f'"dyGEO".{interval}_economic_indicator_log'
+            # ==============================================================================
+            # STEP 2: FORWARD/BACKWARD FILL MISSING VALUES
+            # ==============================================================================
+            logger.info("[TRANSFORMATION] Applying forward/backward fill for missing values...")
+            # One commit for the whole fill step; a savepoint per table keeps one failure from undoing the others
+            try:
+                for interval, table_name, column_names in _FILL_PLAN:
+                    cursor.execute('SAVEPOINT fill_sp')
                     try:
-                        forward_backward_fill_indicator(cursor, table_name, column_name, interval)
-                        conn.commit()
+                        forward_backward_fill_indicator(cursor, table_name, column_names, interval)
                     except Exception as e:
-                        print(f"[WARN] Forward/backward fill failed for {column_name}: {e}")
-                        try:
-                            conn.rollback()
-                        except Exception:
-                            pass
+                        cursor.execute('ROLLBACK TO SAVEPOINT fill_sp')
+                        logger.warning("[WARN] Forward/backward fill failed for %s: %s", table_name, e)
+                    else:
+                        cursor.execute('RELEASE SAVEPOINT fill_sp')
+            finally:
+                conn.commit()
 
         # Print economic indicators summary
         if total_indicators_inserted > 0:
-            print(f"\n[LOAD] Economic indicators summary: {total_indicators_inserted} new records inserted")
+            logger.info("[LOAD] Economic indicators summary: %s new records inserted", total_indicators_inserted)
         elif indicators_already_available:
-            print(f"\n[LOAD] Economic indicators summary: Data already available for recent dates")
+            logger.info("[LOAD] Economic indicators summary: Data already available for recent dates")
         else:
-            print("\n[LOAD] Economic indicators summary: No new records inserted")
+            logger.info("[LOAD] Economic indicators summary: No new records inserted")
 
         # ==============================================================================
         # STEP 3: PROCESS ASSET EVENTS
         # ==============================================================================
-        total_events_inserted = process_events(cursor, only_symbols)
+        # Extra pooled connections read existing events alongside the API calls
+        total_events_inserted = process_events(cursor, only_symbols, pg_pool, force_refresh)
 
         # ==============================================================================
         # STEP 4: FINALIZE AND CLEANUP
         # ==============================================================================
-        print("\n[LOAD] Committing all transactions...")
+        logger.info("[LOAD] Committing all transactions...")
         try:
             conn.commit()
-            print("[LOAD] All transactions committed successfully")
+            logger.info("[LOAD] All transactions committed successfully")
         except Exception as e:
-            print(f"[ERROR] Failed to commit transactions: {e}")
+            logger.error("[ERROR] Failed to commit transactions: %s", e)
             try:
                 conn.rollback()
             except Exception:
                 pass
         
-        # Close database connections
+        # Close the cursor; the connection goes back to the pool below
         try:
             cursor.close()
-            conn.close()
-            print("[DB] Database connections closed")
         except Exception as e:
-            print(f"[WARN] Error closing database connections: {e}")
+            logger.warning("[WARN] Error closing database cursor: %s", e)
         
         # Final results
         result = {
@@ -917,29 +1219,41 @@ def resolve_EIE(_, info, tickers_list=None):
             "message": "ETL process completed successfully"
         }
         
-        print("\n" + "="*80)
-        print("ETL PROCESS COMPLETED SUCCESSFULLY")
-        print(f"Economic indicators inserted: {total_indicators_inserted}")
-        print(f"Asset events inserted: {total_events_inserted}")
-        print("="*80)
+        logger.info("=" * 80)
+        logger.info("ETL PROCESS COMPLETED SUCCESSFULLY")
+        logger.info("Economic indicators inserted: %s", total_indicators_inserted)
+        logger.info("Asset events inserted: %s", total_events_inserted)
+        logger.info("=" * 80)
         
         return result
         
-    except Exception as e:
-        # Handle any unexpected errors
-        print(f"\n[ERROR] Critical error in resolve_EIE: {e}")
-        try:
-            return {
-                "success": False, 
-                "error": str(e),
-                "message": "ETL process failed due to unexpected error"
-            }
-        except Exception:
-            return {
-                "success": False, 
-                "error": "Unknown error occurred",
-                "message": "ETL process failed"
-            }
+    except (psycopg2.Error, RequestException, OSError) as e:
+        # Database, HTTP and I/O failures end the run with an error result; programming errors propagate
+        logger.exception("[ERROR] Critical error in resolve_EIE: %s", e)
+        return {
+            "success": False, 
+            "error": str(e),
+            "message": "ETL process failed due to unexpected error"
+        }
+    except KeyError as e:
+        # Configuration/lookup dicts missing an expected entry
+        logger.exception("[ERROR] Missing key in resolve_EIE: %s", e)
+        return {
+            "success": False, 
+            "error": f"Missing key: {e}",
+            "message": "ETL process failed"
+        }
+    finally:
+        # Drop memoized API responses so the next run fetches fresh data
+        clear_all_caches()
+
+        # Return the connection to the pool (broken connections are discarded, open transactions rolled back)
+        if conn is not None:
+            try:
+                pg_pool.putconn(conn, close=bool(conn.closed))
+                logger.info("[DB] Database connection returned to pool")
+            except Exception as e:
+                logger.warning("[WARN] Error returning database connection to pool: %s", e)
 
 
 # ==============================================================================
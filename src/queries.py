@@ -1,134 +1,236 @@
 import requests
-import json
+import csv
+import io
+import logging
+import orjson
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+try:
+    import brotli  # noqa: F401 - lets urllib3 decode br-encoded responses
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+logger = logging.getLogger(__name__)
 # from datetime import datetime
+# Seconds to wait on connect/read before giving up on an API call
+REQUEST_TIMEOUT = 10
+# Response cache lifetimes in seconds - macro series move slowly, the earnings calendar does not
+CACHE_TTL = {'daily': 6 * 3600, 'weekly': 86400, 'monthly': 7 * 86400, 'quarterly': 7 * 86400,
+             'semiannual': 7 * 86400, 'annual': 7 * 86400, 'events': 86400, 'calendar': 3600}
+# Alpha Vantage returns throttle/error notices as HTTP 200 JSON under these keys
+API_NOTICE_KEYS = ('Note', 'Information', 'Error Message')
+
+# Cache filter: only store real payloads - notices are short JSON objects, so larger bodies skip the parse
+def _cacheable(response):
+    if response.status_code != 200 or not response.content:
+        return False
+    body = response.content.lstrip()
+    if body[:1] != b'{' or len(body) > 4096:
+        return True
+    try:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return True
+    return bool(data) and not any(key in data for key in API_NOTICE_KEYS)
+
+# Shared keep-alive session - pools connections and reuses TLS sessions across API calls,
+# retrying throttled (429) and transient 5xx responses with backoff; responses are cached
+# on disk (.cache/alphavantage.sqlite) when requests-cache is installed
+if CachedSession is not None:
+    SESSION = CachedSession('.cache/alphavantage', backend='sqlite', expire_after=CACHE_TTL['events'], allowable_methods=('GET',), filter_fn=_cacheable)
+else:
+    SESSION = requests.Session()
+# Ask for compressed bodies explicitly (br only when brotli is installed to decode it)
+SESSION.headers.update({'Accept-Encoding': ACCEPT_ENCODING})
+SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504], allowed_methods=['GET'], raise_on_status=False)))
+
+# GET through the session, applying the per-endpoint TTL (force_refresh bypasses any cached response)
+def _get(session, url, ttl, force_refresh=False):
+    if CachedSession is not None and isinstance(session, CachedSession):
+        r = session.get(url, timeout=REQUEST_TIMEOUT, expire_after=CACHE_TTL.get(ttl, CACHE_TTL['events']), force_refresh=force_refresh)
+    else:
+        r = session.get(url, timeout=REQUEST_TIMEOUT)
+    _log_encoding(url, r)
+    return r
+
+# Endpoints whose response Content-Encoding has been logged (once per API function)
+_ENCODING_LOGGED = set()
+
+def _log_encoding(url, r):
+    function = url.split('function=', 1)[1].split('&', 1)[0]
+    if function not in _ENCODING_LOGGED:
+        _ENCODING_LOGGED.add(function)
+        logger.info("[INFO] %s response Content-Encoding: %s", function, r.headers.get('Content-Encoding') or 'identity')
+
+# Decode a JSON response body with orjson (faster than r.json()); empty bodies decode to {}
+def _parse(r):
+    return orjson.loads(r.content) if r.content else {}
+
+# Decode a datatype=csv series (timestamp,value rows) into the JSON shape {"data": [{"date", "value"}]};
+# error and rate-limit replies still come back as JSON
+def _parse_series(r):
+    text = r.text
+    if not text or text.lstrip().startswith('{'):
+        return _parse(r)
+    rows = csv.reader(io.StringIO(text))
+    next(rows, None)
+    return {"data": [{"date": row[0], "value": row[1]} for row in rows if len(row) >= 2]}
+
 #for economical indicators
 
-def TREASURY_YIELD(interval):
-    url = f'https://www.alphavantage.co/query?function=TREASURY_YIELD&interval={interval}&maturity=10year&apikey=E8VCMZJEKYQS5Q7W'
-    r = requests.get(url)
-    data = r.json()
+@lru_cache(maxsize=128)
+def TREASURY_YIELD(interval, session=SESSION, force_refresh=False):
+    url = f'https://www.alphavantage.co/query?function=TREASURY_YIELD&interval={interval}&maturity=10year&datatype=csv&apikey=E8VCMZJEKYQS5Q7W'
+    r = _get(session, url, interval, force_refresh)
+    data = _parse_series(r)
 
     # print(data)
     return data
-def FEDERAL_FUNDS_RATE(interval):
+@lru_cache(maxsize=128)
+def FEDERAL_FUNDS_RATE(interval, session=SESSION, force_refresh=False):
  
     # replace the "E8VCMZJEKYQS5Q7W" apikey below with your own key from https://www.alphavantage.co/support/#api-key
-    url = f'https://www.alphavantage.co/query?function=FEDERAL_FUNDS_RATE&interval={interval}&apikey=E8VCMZJEKYQS5Q7W'
-    r = requests.get(url)
-    data = r.json()
+    url = f'https://www.alphavantage.co/query?function=FEDERAL_FUNDS_RATE&interval={interval}&datatype=csv&apikey=E8VCMZJEKYQS5Q7W'
+    r = _get(session, url, interval, force_refresh)
+    data = _parse_series(r)
 
     # print(data)
     return data
 
-def CPI(interval):
+@lru_cache(maxsize=128)
+def CPI(interval, session=SESSION, force_refresh=False):
  
     # replace the "E8VCMZJEKYQS5Q7W" apikey below with your own key from https://www.alphavantage.co/support/#api-key
-    url = f'https://www.alphavantage.co/query?function=CPI&interval={interval}&apikey=E8VCMZJEKYQS5Q7W'
-    r = requests.get(url)
-    data = r.json()
+    url = f'https://www.alphavantage.co/query?function=CPI&interval={interval}&datatype=csv&apikey=E8VCMZJEKYQS5Q7W'
+    r = _get(session, url, interval, force_refresh)
+    data = _parse_series(r)
 
     # print(data)
     return data
 
-def RETAIL_SALES():
+@lru_cache(maxsize=128)
+def RETAIL_SALES(session=SESSION, force_refresh=False):
  
     # replace the "E8VCMZJEKYQS5Q7W" apikey below with your own key from https://www.alphavantage.co/support/#api-key
     url = 'https://www.alphavantage.co/query?function=RETAIL_SALES&apikey=E8VCMZJEKYQS5Q7W'
-    r = requests.get(url)
-    data = r.json()
+    r = _get(session, url, 'monthly', force_refresh)
+    data = _parse(r)
 
     # print(data)
     return data
 
-def INFLATION():
+@lru_cache(maxsize=128)
+def INFLATION(session=SESSION, force_refresh=False):
  
     # replace the "E8VCMZJEKYQS5Q7W" apikey below with your own key from https://www.alphavantage.co/support/#api-key
     url = 'https://www.alphavantage.co/query?function=INFLATION&apikey=E8VCMZJEKYQS5Q7W'
-    r = requests.get(url)
-    data = r.json()
+    r = _get(session, url, 'monthly', force_refresh)
+    data = _parse(r)
 
     # print(data)
     return data
 
-def DURABLES():
+@lru_cache(maxsize=128)
+def DURABLES(session=SESSION, force_refresh=False):
  
     # replace the "E8VCMZJEKYQS5Q7W" apikey below with your own key from https://www.alphavantage.co/support/#api-key
     url = 'https://www.alphavantage.co/query?function=DURABLES&apikey=E8VCMZJEKYQS5Q7W'
-    r = requests.get(url)
-    data = r.json()
+    r = _get(session, url, 'monthly', force_refresh)
+    data = _parse(r)
 
     # print(data)
     return data
 
-def UNEMPLOYMENT():
+@lru_cache(maxsize=128)
+def UNEMPLOYMENT(session=SESSION, force_refresh=False):
  
     # replace the "E8VCMZJEKYQS5Q7W" apikey below with your own key from https://www.alphavantage.co/support/#api-key
     url = 'https://www.alphavantage.co/query?function=UNEMPLOYMENT&apikey=E8VCMZJEKYQS5Q7W'
-    r = requests.get(url)
-    data = r.json()
+    r = _get(session, url, 'monthly', force_refresh)
+    data = _parse(r)
 
     # print(data)
     return data
 
-def NONFARM_PAYROLL():
+@lru_cache(maxsize=128)
+def NONFARM_PAYROLL(session=SESSION, force_refresh=False):
  
     # replace the "E8VCMZJEKYQS5Q7W" apikey below with your own key from https://www.alphavantage.co/support/#api-key
     url = 'https://www.alphavantage.co/query?function=NONFARM_PAYROLL&apikey=E8VCMZJEKYQS5Q7W'
-    r = requests.get(url)
-    data = r.json()
+    r = _get(session, url, 'monthly', force_refresh)
+    data = _parse(r)
 
     # print(data)
     return data
 
-def REAL_GDP(interval):
-    url = f'https://www.alphavantage.co/query?function=REAL_GDP&interval={interval}&apikey=E8VCMZJEKYQS5Q7W'
-    r = requests.get(url)
-    data = r.json()
+@lru_cache(maxsize=128)
+def REAL_GDP(interval, session=SESSION, force_refresh=False):
+    url = f'https://www.alphavantage.co/query?function=REAL_GDP&interval={interval}&datatype=csv&apikey=E8VCMZJEKYQS5Q7W'
+    r = _get(session, url, interval, force_refresh)
+    data = _parse_series(r)
 
     # print(data)
     return data
 
-def REAL_GDP_PC():
+@lru_cache(maxsize=128)
+def REAL_GDP_PC(session=SESSION, force_refresh=False):
     url = 'https://www.alphavantage.co/query?function=REAL_GDP_PER_CAPITA&apikey=E8VCMZJEKYQS5Q7W'
-    r = requests.get(url)
-    data = r.json()
+    r = _get(session, url, 'annual', force_refresh)
+    data = _parse(r)
 
     # print(data)
     return data
 
 # Alpha Vantage functions for financial events
-def EARNINGS(symbol):
+@lru_cache(maxsize=128)
+def EARNINGS(symbol, session=SESSION, force_refresh=False):
     url = f'https://www.alphavantage.co/query?function=EARNINGS&symbol={symbol}&apikey=E8VCMZJEKYQS5Q7W'
-    r = requests.get(url)
+    r = _get(session, url, 'events', force_refresh)
     try:
-        data = r.json()
+        data = _parse(r)
     except:
         data = {"error": "Failed to parse JSON response"}
     return {"status": r.status_code, "data": data}
 
-def DIVIDENDS(symbol):
+@lru_cache(maxsize=128)
+def DIVIDENDS(symbol, session=SESSION, force_refresh=False):
     url = f'https://www.alphavantage.co/query?function=DIVIDENDS&symbol={symbol}&apikey=E8VCMZJEKYQS5Q7W'
-    r = requests.get(url)
+    r = _get(session, url, 'events', force_refresh)
     try:
-        data = r.json()
+        data = _parse(r)
     except:
         data = {"error": "Failed to parse JSON response"}
     return {"status": r.status_code, "data": data}
 
-def STOCK_SPLITS(symbol):
+@lru_cache(maxsize=128)
+def STOCK_SPLITS(symbol, session=SESSION, force_refresh=False):
     url = f'https://www.alphavantage.co/query?function=SPLITS&symbol={symbol}&apikey=E8VCMZJEKYQS5Q7W'
-    r = requests.get(url)
+    r = _get(session, url, 'events', force_refresh)
     try:
-        data = r.json()
+        data = _parse(r)
     except:
         data = {"error": "Failed to parse JSON response"}
     return {"status": r.status_code, "data": data}
 
-def EARNINGS_CALENDAR(symbol):
+@lru_cache(maxsize=128)
+def EARNINGS_CALENDAR(symbol, session=SESSION, force_refresh=False):
     url = f'https://www.alphavantage.co/query?function=EARNINGS_CALENDAR&symbol={symbol}&horizon=3month&apikey=E8VCMZJEKYQS5Q7W'
-    r = requests.get(url)
+    r = _get(session, url, 'calendar', force_refresh)
     try:
-        data = r.json()
+        data = _parse(r)
     except:
         data = r.text
-    return {"status": r.status_code, "data": data}
\ No newline at end of file
+    return {"status": r.status_code, "data": data}
+
+# Responses are memoized per (function, args) within an ETL run; resolve_EIE clears them when it finishes
+CACHED_QUERIES = (TREASURY_YIELD, FEDERAL_FUNDS_RATE, CPI, RETAIL_SALES, INFLATION, DURABLES, UNEMPLOYMENT, NONFARM_PAYROLL, REAL_GDP, REAL_GDP_PC, EARNINGS, DIVIDENDS, STOCK_SPLITS, EARNINGS_CALENDAR)
+
+def clear_all_caches():
+    for func in CACHED_QUERIES:
+        func.cache_clear()
@@ -1,5 +1,8 @@
 import os
+import threading
+from types import MappingProxyType
 from dotenv import load_dotenv
+from psycopg2.pool import ThreadedConnectionPool
 
 # Load environment variables from .env file
 load_dotenv()
@@ -14,3 +17,25 @@ DATABASE_PORT = int(os.getenv('DATABASE_PORT', 5432))
 # Server configuration
 SERVER_HOST = os.getenv('SERVER_HOST', '0.0.0.0')
 SERVER_PORT = int(os.getenv('SERVER_PORT', 5000))
+
+# Database connection configuration (read-only view)
+CONNECTION_PARAMS = MappingProxyType({
+    "host": DATABASE_HOST,
+    "port": DATABASE_PORT,
+    "user": USER,
+    "password": PASSWORD,
+    "database": DBNAME
+})
+
+# Process-wide connection pool, created on first use (not at import, so preloaded server workers don't share sockets)
+_PG_POOL = None
+_PG_POOL_LOCK = threading.Lock()
+
+def get_pg_pool():
+    """Return the shared ThreadedConnectionPool, creating it on first call"""
+    global _PG_POOL
+    if _PG_POOL is None:
+        with _PG_POOL_LOCK:
+            if _PG_POOL is None:
+                _PG_POOL = ThreadedConnectionPool(2, 20, **CONNECTION_PARAMS)
+    return _PG_POOL